@@ -1,17 +1,38 @@
 import os
 import re
+import sys
+import codecs
+import zlib
+import unicodedata
 import json
+import hashlib
+import math
+import heapq
+import itertools
+import sqlite3
 import random
 import logging
 import time
+import asyncio
 import threading
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict, deque
+from html import unescape
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable, AsyncIterator, Iterable
 from datetime import datetime, timedelta
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 import uvicorn
 
 # Configure logging
@@ -21,8 +42,324 @@ logging.basicConfig(
 )
 logger = logging.getLogger("job_scraper")
 
+# Shared HTTP client settings for upstream job boards
+HTTP_POOL_LIMIT = int(os.environ.get("JOB_SCRAPER_POOL_LIMIT", "100"))  # Total open connections
+HTTP_POOL_LIMIT_PER_HOST = int(os.environ.get("JOB_SCRAPER_POOL_LIMIT_PER_HOST", "10"))  # Connections per job board
+HTTP_DNS_CACHE_TTL = int(os.environ.get("JOB_SCRAPER_DNS_CACHE_TTL", "300"))  # Seconds to cache DNS lookups
+HTTP_KEEPALIVE_TIMEOUT = float(os.environ.get("JOB_SCRAPER_KEEPALIVE_TIMEOUT", "30"))  # Seconds to keep idle connections
+HTTP_REQUEST_TIMEOUT = float(os.environ.get("JOB_SCRAPER_REQUEST_TIMEOUT", "15"))  # Seconds per upstream request
+
+# Deadlines for multi-source searches, kept below the 15 second timeout of the Node caller
+SOURCE_TIMEOUT = float(os.environ.get("JOB_SCRAPER_SOURCE_TIMEOUT", "8"))  # Seconds allowed per job board
+SEARCH_BUDGET = float(os.environ.get("JOB_SCRAPER_SEARCH_BUDGET", "12"))  # Seconds allowed per search, fallback included
+
+# Where results pages are parsed: "process" (a pool using every core), "thread" or "inline" on the event loop
+PARSE_EXECUTOR_KIND = os.environ.get("JOB_SCRAPER_PARSE_EXECUTOR", "process")
+PARSE_WORKERS = int(os.environ.get("JOB_SCRAPER_PARSE_WORKERS", "0")) or os.cpu_count() or 1  # 0 means one per core
+
+# Results pages fetched per job board search, 1 disables pagination; JOB_SCRAPER_MAX_PAGES_<SITE> overrides it per board
+MAX_PAGES = int(os.environ.get("JOB_SCRAPER_MAX_PAGES", "1"))
+PAGE_DEADLINE_MARGIN = 0.25  # Seconds before a source's deadline at which pagination returns what it has
+
+# Results pages are read in chunks, up to a size cap, and reading stops once enough job cards have arrived
+MAX_RESPONSE_BYTES = int(os.environ.get("JOB_SCRAPER_MAX_RESPONSE_BYTES", str(2 * 1024 * 1024)))
+STREAM_EARLY_STOP = os.environ.get("JOB_SCRAPER_STREAM_EARLY_STOP", "1") != "0"
+STREAM_CHUNK_SIZE = 16 * 1024
+STREAM_STATS = {"pages": 0, "early_stops": 0, "truncated": 0, "bytes_read": 0}
+
+# Long-lived client session, opened at startup and closed at shutdown
+HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create a pooled client session with keep-alive and DNS caching"""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        use_dns_cache=True,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+    )
+    timeout = aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared client session, creating it if the app has not started it yet"""
+    global HTTP_SESSION
+
+    if HTTP_SESSION is None or HTTP_SESSION.closed:
+        HTTP_SESSION = create_http_session()
+    return HTTP_SESSION
+
+async def close_http_session() -> None:
+    """Close the shared client session and release pooled connections"""
+    global HTTP_SESSION
+
+    if HTTP_SESSION is not None and not HTTP_SESSION.closed:
+        await HTTP_SESSION.close()
+    HTTP_SESSION = None
+
+# Pool that parses results pages off the event loop, created on first use and shut down with the app
+PARSE_EXECUTOR: Optional[Executor] = None
+
+def get_parse_executor() -> Optional[Executor]:
+    """Get the shared parse executor, or None when pages are parsed inline"""
+    global PARSE_EXECUTOR
+
+    if PARSE_EXECUTOR is None and PARSE_EXECUTOR_KIND != "inline":
+        if PARSE_EXECUTOR_KIND == "thread":
+            PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="job-parser")
+        else:
+            PARSE_EXECUTOR = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+        logger.info(f"Started {PARSE_EXECUTOR_KIND} parse pool with {PARSE_WORKERS} workers")
+    return PARSE_EXECUTOR
+
+def close_parse_executor() -> None:
+    """Shut down the parse pool, dropping parses that have not started"""
+    global PARSE_EXECUTOR
+
+    if PARSE_EXECUTOR is not None:
+        PARSE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    PARSE_EXECUTOR = None
+
+def response_encoding(response: aiohttp.ClientResponse) -> str:
+    """Get the declared charset of a response, falling back to UTF-8 like aiohttp does"""
+    encoding = response.charset or "utf-8"
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return "utf-8"
+
+@dataclass
+class FetchedPage:
+    """Raw response to a page request, with the validators for revalidating it later"""
+    body: bytes
+    encoding: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+    # Length of the body up to the end of the last job card needed, when reading stopped there
+    cards_end: Optional[int] = None
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Hash of the body and its encoding, to detect a page that came back unchanged
+
+        When reading stopped early, only the body up to the end of the last
+        job card needed is hashed. The rest is wherever the network happened
+        to split the chunks, and the parse does not depend on it.
+        """
+        body = self.body if self.cards_end is None else self.body[:self.cards_end]
+        return hashlib.blake2b(self.encoding.encode("ascii") + b"\0" + body, digest_size=16).hexdigest()
+
+async def fetch_page(
+    url: str,
+    counter: Optional["CardCounter"] = None,
+    conditions: Optional[Dict[str, str]] = None
+) -> FetchedPage:
+    """
+    Fetch the raw body of a page from a job board, and its encoding, using the shared client session
+
+    The body is read in chunks and cut off at MAX_RESPONSE_BYTES. With a card
+    counter, reading also stops as soon as it has seen enough complete job
+    cards, leaving the rest of the page undownloaded. Conditional request
+    headers may be given; a 304 response comes back as an empty page marked
+    not modified.
+    """
+    session = get_http_session()
+    headers = get_random_headers()
+    if conditions:
+        headers.update(conditions)
+    async with session.get(url, headers=headers) as response:
+        response.raise_for_status()
+        encoding = response_encoding(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status == 304:
+            PAGE_CACHE_STATS["not_modified"] += 1
+            return FetchedPage(b"", encoding, etag, last_modified, not_modified=True)
+        chunks = []
+        size = 0
+        cards_end = None
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if counter is not None and counter.feed_chunk(chunk, encoding):
+                logger.info(f"Stopped reading {url} after {counter.complete} job cards ({size} bytes)")
+                STREAM_STATS["early_stops"] += 1
+                cards_end = counter.end
+                break
+            if size >= MAX_RESPONSE_BYTES:
+                logger.warning(f"Response from {url} exceeded {MAX_RESPONSE_BYTES} bytes, parsing the first part only")
+                STREAM_STATS["truncated"] += 1
+                break
+
+        STREAM_STATS["pages"] += 1
+        STREAM_STATS["bytes_read"] += size
+        return FetchedPage(b"".join(chunks), encoding, etag, last_modified, cards_end=cards_end)
+
+def normalize_url(url: str) -> str:
+    """Normalize an upstream URL so equivalent requests share one key"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one execution
+
+    Callers arriving while a call for the same key is running await its result
+    instead of starting their own. A call started with a size (such as a job
+    limit) is only joined by callers that need no more than that size.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: Dict[str, Tuple[int, asyncio.Future]] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """Check if a call for the key is currently running"""
+        return key in self._calls
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]], size: int = 0) -> Any:
+        """Run factory() for the key, or join the call already running for it"""
+        call = self._calls.get(key)
+        if call is not None and call[0] >= size:
+            self.coalesced += 1
+            logger.info(f"Coalesced {self.name} call for key: {key}")
+            return await asyncio.shield(call[1])
+
+        task = asyncio.ensure_future(factory())
+        self._calls[key] = (size, task)
+        self.executed += 1
+        task.add_done_callback(lambda done: self._finish(key, done))
+
+        # Shield the shared call so one cancelled caller does not cancel it for the others
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        """Forget a finished call so later callers start a new one"""
+        call = self._calls.get(key)
+        if call is not None and call[1] is task:
+            del self._calls[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"{self.name} call for key {key} failed: {task.exception()}")
+
+    def stats(self) -> Dict[str, int]:
+        """Get counters for executed and coalesced calls"""
+        return {
+            "in_flight": len(self._calls),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+        }
+
+# Concurrent scrapes of the same results page share one fetch and parse
+SCRAPE_FLIGHTS = SingleFlight("scrape")
+
+async def fetch_jobs(
+    url: str,
+    limit: int,
+    parse: Callable[[bytes, str, int], Awaitable[List["JobRecord"]]],
+    fetch: Callable[[str, Optional[Dict[str, str]]], Awaitable[FetchedPage]] = fetch_page
+) -> List["JobRecord"]:
+    """
+    Fetch and parse a results page, sharing the work with concurrent callers of the same URL
+
+    The jobs parsed from each page are kept in the page cache with the page's
+    validators and content hash. When a cached parse covers `limit`, the page
+    is requested conditionally, and its jobs are reused without parsing if the
+    upstream answers 304 Not Modified or sends back the same body. A 304 also
+    renews the entry's time to live.
+    """
+    key = normalize_url(url)
+
+    async def fetch_and_parse():
+        cached = await PAGE_CACHE.get_async(key)
+        if cached is not None and cached["limit"] < limit and len(cached["jobs"]) >= cached["limit"]:
+            # Parsed for a smaller limit, with more jobs possibly on the page
+            cached = None
+
+        conditions = {}
+        if cached is not None:
+            if cached.get("etag"):
+                conditions["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                conditions["If-Modified-Since"] = cached["last_modified"]
+
+        page = await fetch(url, conditions or None)
+        if page.not_modified and cached is not None:
+            logger.info(f"Reusing parsed jobs for unmodified page {url}")
+            # Store the entry again, so a page that keeps being revalidated stays cached
+            PAGE_CACHE.set(key, {
+                **cached,
+                "etag": page.etag or cached.get("etag"),
+                "last_modified": page.last_modified or cached.get("last_modified"),
+            })
+            return cached["jobs"]
+
+        content_hash = page.content_hash
+        if cached is not None and cached["hash"] == content_hash:
+            PAGE_CACHE_STATS["unchanged"] += 1
+            logger.info(f"Reusing parsed jobs for unchanged page {url}")
+            jobs = cached["jobs"]
+        else:
+            PAGE_CACHE_STATS["parsed"] += 1
+            jobs = await parse(page.body, page.encoding, limit)
+
+        PAGE_CACHE.set(key, {
+            "jobs": jobs,
+            "limit": limit,
+            "hash": content_hash,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+        })
+        return jobs
+
+    jobs = await SCRAPE_FLIGHTS.do(key, fetch_and_parse, size=limit)
+    return jobs[:limit]
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources at startup and release them at shutdown"""
+    global BATCH_SEMAPHORE
+
+    get_http_session()
+    logger.info("Opened shared HTTP client session")
+
+    if CACHE_WARM_ON_STARTUP:
+        for name, cache in (("recommendation", JOB_CACHE), ("source", SOURCE_CACHE), ("page", PAGE_CACHE)):
+            try:
+                warmed = await asyncio.to_thread(cache.warm)
+                if warmed:
+                    logger.info(f"Warmed {name} cache with {warmed} persisted entries")
+            except sqlite3.Error as e:
+                logger.error(f"Error warming {name} cache: {str(e)}")
+
+    get_parse_executor()
+    REFRESH_SCHEDULER.start()
+
+    try:
+        yield
+    finally:
+        await REFRESH_SCHEDULER.stop()
+        await close_http_session()
+        logger.info("Closed shared HTTP client session")
+        close_parse_executor()
+        # The semaphore belongs to this event loop
+        BATCH_SEMAPHORE = None
+
+        for cache in (JOB_CACHE, SOURCE_CACHE, PAGE_CACHE):
+            await asyncio.to_thread(cache.close)
+        if JOB_INDEX is not None:
+            # Let pending index writes finish before closing the connection they use
+            if INDEX_WRITES:
+                await asyncio.gather(*INDEX_WRITES, return_exceptions=True)
+            JOB_INDEX.close()
+
 # Initialize FastAPI app
-app = FastAPI(title="Job Scraper API")
+app = FastAPI(title="Job Scraper API", lifespan=lifespan)
 
 # Add CORS middleware to allow requests from the frontend
 app.add_middleware(
@@ -33,109 +370,983 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Cache for job recommendations
-# Structure: {cache_key: {"timestamp": datetime, "data": response_data}}
-JOB_CACHE = {}
+# Fields of a job listing, in the order they appear in responses
+JOB_FIELDS = ("title", "company", "location", "salary", "type", "summary", "url", "source", "posted")
+
+# Fields that take the same few values across many listings, such as "Not specified", "Recently" or a board name
+INTERNED_JOB_FIELDS = ("company", "location", "salary", "type", "source", "posted")
+
+@dataclass(frozen=True, slots=True)
+class JobRecord:
+    """
+    One job listing
+
+    Records are immutable, so cached job lists are shared rather than copied,
+    and their repetitive fields are interned so all records hold one copy of
+    each distinct value. They become JSON objects only when a response or a
+    persisted cache entry is encoded.
+    """
+    title: Optional[str]
+    company: Optional[str]
+    location: Optional[str]
+    salary: Optional[str]
+    type: Optional[str]
+    summary: Optional[str]
+    url: Optional[str]
+    source: Optional[str]
+    posted: Optional[str]
+
+    def __post_init__(self):
+        for name in INTERNED_JOB_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
+
+    def __reduce__(self):
+        # Rebuild through __init__ when unpickled, so records parsed in worker processes are interned here
+        return JobRecord, tuple(getattr(self, name) for name in JOB_FIELDS)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobRecord":
+        """Rebuild a record from its JSON object"""
+        return cls(*(data.get(name) for name in JOB_FIELDS))
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """JSON-serializable form of the record"""
+        return {name: getattr(self, name) for name in JOB_FIELDS}
+
+def json_default(value: Any) -> Any:
+    """Encode job records for json.dumps, and anything else it cannot encode as a string"""
+    if isinstance(value, JobRecord):
+        return value.to_dict()
+    return str(value)
+
+def decode_cached_jobs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn the jobs of a cache entry loaded from JSON back into job records"""
+    return {**data, "jobs": [JobRecord.from_dict(job) for job in data["jobs"]]}
+
 CACHE_DURATION = timedelta(minutes=30)  # Cache results for 30 minutes
+CACHE_STALE_GRACE = timedelta(seconds=int(os.environ.get("JOB_SCRAPER_CACHE_STALE_GRACE", "3600")))  # Serve expired results this long while revalidating
+CACHE_MAX_ENTRIES = int(os.environ.get("JOB_SCRAPER_CACHE_MAX_ENTRIES", "1000"))  # Entries kept before evicting
+CACHE_MAX_BYTES = int(os.environ.get("JOB_SCRAPER_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # Approximate size budget
 
-# Background job cache refresh
-BACKGROUND_REFRESH_RUNNING = False
+# Optional persistent cache, so restarts and sibling processes don't start cold
+CACHE_DB_PATH = os.environ.get("JOB_SCRAPER_CACHE_DB", "")  # SQLite file path, empty to keep the cache in memory only
+CACHE_WARM_ON_STARTUP = os.environ.get("JOB_SCRAPER_CACHE_WARM", "1") == "1"  # Load persisted entries into memory at startup
 
-def get_cache_key(skills: str, experience_level: Optional[str], limit: int) -> str:
-    """Generate a cache key from request parameters"""
-    return f"{skills}_{experience_level}_{limit}"
+class SQLiteCacheStore:
+    """
+    Persistent backing store for JobCache, one SQLite table per cache
 
-def is_cache_valid(cache_key: str) -> bool:
-    """Check if cache entry is valid and not expired"""
-    if cache_key not in JOB_CACHE:
-        return False
+    The database runs in WAL mode so several scraper processes can share it,
+    and expiry times are indexed so expired rows can be purged cheaply.
+    Cached data and metadata are stored as JSON.
+    """
 
-    cache_time = JOB_CACHE[cache_key]["timestamp"]
-    now = datetime.now()
-    return now - cache_time < CACHE_DURATION
-
-def get_cached_jobs(cache_key: str) -> Dict[str, Any]:
-    """Get cached job recommendations"""
-    if is_cache_valid(cache_key):
-        logger.info(f"Using cached job recommendations for key: {cache_key}")
-        return JOB_CACHE[cache_key]["data"]
-    return None
-
-def set_cached_jobs(cache_key: str, data: Dict[str, Any]) -> None:
-    """Cache job recommendations"""
-    JOB_CACHE[cache_key] = {
-        "timestamp": datetime.now(),
-        "data": data
-    }
-    logger.info(f"Cached job recommendations for key: {cache_key}")
+    def __init__(self, path: str, table: str):
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, created_at REAL NOT NULL, expires_at REAL NOT NULL, "
+            "data TEXT NOT NULL, meta TEXT)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_expires_at ON {table} (expires_at)")
+
+    def load(self, key: str) -> Optional[Tuple[datetime, str, Optional[str]]]:
+        """Load an unexpired entry as (timestamp, data JSON, meta JSON)"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT created_at, data, meta FROM {self.table} WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        if row is None:
+            return None
+        return datetime.fromtimestamp(row[0]), row[1], row[2]
+
+    def load_recent(self, limit: int) -> List[Tuple[str, datetime, str, Optional[str]]]:
+        """Load up to `limit` unexpired entries, oldest first, as (key, timestamp, data JSON, meta JSON)"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, created_at, data, meta FROM {self.table} WHERE expires_at > ? "
+                "ORDER BY created_at DESC LIMIT ?",
+                (time.time(), limit)
+            ).fetchall()
+        return [(key, datetime.fromtimestamp(created_at), data, meta) for key, created_at, data, meta in reversed(rows)]
+
+    def save(self, key: str, timestamp: datetime, ttl: timedelta, data: str, meta: Optional[str]) -> None:
+        """Insert or replace an entry"""
+        created_at = timestamp.timestamp()
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, created_at, expires_at, data, meta) VALUES (?, ?, ?, ?, ?)",
+                (key, created_at, created_at + ttl.total_seconds(), data, meta)
+            )
 
-def background_refresh_cache():
-    """Background task to refresh cache entries before they expire"""
-    global BACKGROUND_REFRESH_RUNNING
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were deleted"""
+        with self._lock:
+            return self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),)).rowcount
 
-    if BACKGROUND_REFRESH_RUNNING:
-        return
+    def count(self) -> int:
+        """Count stored entries, expired ones included"""
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
 
-    BACKGROUND_REFRESH_RUNNING = True
+class JobCache:
+    """
+    Bounded, thread-safe LRU cache with a time to live
+
+    Entries are evicted least recently used first once either the entry count
+    or the approximate byte budget is exceeded, and expire after the TTL.
+    Expired entries are kept for a further grace period, during which lookup()
+    still returns them marked as stale. Sizes are estimated from the JSON
+    encoding of the cached data.
+
+    With a store, writes go through to it and memory misses fall back to it, so
+    entries outlive restarts and are shared with other processes. Data and
+    metadata must then be JSON-serializable, job records included, and decode
+    turns data loaded from the store back into the form it was cached in.
+    Writes are queued to the CACHE_WRITER thread, and lookup_async() reads the
+    store in a worker thread, so the event loop never waits on SQLite. The
+    lock only guards the in-memory entries and is never held during store I/O.
+    """
 
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl: timedelta,
+        store: Optional[SQLiteCacheStore] = None,
+        grace: timedelta = timedelta(0),
+        decode: Optional[Callable[[Any], Any]] = None
+    ):
+        self.store = store
+        self.decode = decode or (lambda data: data)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.grace = grace
+        self.total_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        # Structure: {cache_key: (timestamp, data, size, meta)}, least recently used first
+        self._entries: "OrderedDict[str, Tuple[datetime, Any, int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, timestamp: datetime) -> bool:
+        return datetime.now() - timestamp < self.ttl
+
+    def _is_retained(self, timestamp: datetime) -> bool:
+        return datetime.now() - timestamp < self.ttl + self.grace
+
+    def _remove(self, key: str) -> None:
+        _, _, size, _ = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def age(self, key: str) -> Optional[float]:
+        """Get the age in seconds of an entry held in memory, without touching statistics or recency"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return (datetime.now() - entry[0]).total_seconds() if entry is not None else None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a fresh entry and mark it as recently used"""
+        found = self.lookup(key, allow_stale=False)
+        return found[0] if found is not None else None
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        """Get a fresh entry like get(), reading the store in a worker thread on a memory miss"""
+        found = await self.lookup_async(key, allow_stale=False)
+        return found[0] if found is not None else None
+
+    def lookup(self, key: str, allow_stale: bool = True) -> Optional[Tuple[Any, float, bool]]:
+        """
+        Get an entry as (data, age in seconds, stale) and mark it as recently used
+
+        Stale entries are expired but still within the grace period, and are
+        only returned when allow_stale is set.
+        """
+        entry = self._memory_entry(key)
+        if entry is None and self.store is not None:
+            entry = self._load_from_store(key)
+        return self._found(key, entry, allow_stale)
+
+    async def lookup_async(self, key: str, allow_stale: bool = True) -> Optional[Tuple[Any, float, bool]]:
+        """Get an entry like lookup(), reading the store in a worker thread on a memory miss"""
+        entry = self._memory_entry(key)
+        if entry is None and self.store is not None:
+            entry = await asyncio.to_thread(self._load_from_store, key)
+        return self._found(key, entry, allow_stale)
+
+    def _memory_entry(self, key: str) -> Optional[Tuple[datetime, Any, int, Any]]:
+        """Get an entry held in memory, dropping it if past its grace period"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_retained(entry[0]):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            return entry
+
+    def _found(self, key: str, entry: Optional[Tuple[datetime, Any, int, Any]], allow_stale: bool) -> Optional[Tuple[Any, float, bool]]:
+        """Count a lookup's hit or miss and mark the entry found as recently used"""
+        with self._lock:
+            if entry is None or not (allow_stale or self._is_fresh(entry[0])):
+                self.misses += 1
+                return None
+
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            stale = not self._is_fresh(entry[0])
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            return entry[1], (datetime.now() - entry[0]).total_seconds(), stale
+
+    def _load_from_store(self, key: str) -> Optional[Tuple[datetime, Any, int, Any]]:
+        """Load an entry persisted by this or another process into memory"""
+        store = self.store
+        if store is None:
+            return None
+        try:
+            stored = store.load(key)
+        except sqlite3.Error as e:
+            logger.error(f"Error loading key {key} from persistent cache: {str(e)}")
+            return None
+        if stored is None:
+            return None
+        timestamp, data, meta = stored
+        entry = (timestamp, self.decode(json.loads(data)), len(data), json.loads(meta) if meta else None)
+        with self._lock:
+            # Another caller may have stored a newer entry while the store was read
+            current = self._entries.get(key)
+            if current is not None and current[0] >= timestamp:
+                return current
+            self._insert(key, *entry)
+        return entry
+
+    def _insert(self, key: str, timestamp: datetime, data: Any, size: int, meta: Any) -> None:
+        """Insert an entry in memory, evicting least recently used entries to stay within budget"""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (timestamp, data, size, meta)
+        self.total_bytes += size
+
+        while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+            logger.info(f"Evicted cache entry for key: {oldest_key}")
+
+    def set(self, key: str, data: Any, meta: Any = None, age: float = 0.0) -> None:
+        """
+        Store an entry, evicting least recently used entries to stay within budget
+
+        meta is kept alongside the data (e.g. the query that produced it) and is
+        not counted against the byte budget. Data built from older cached data
+        is stored with that data's age in seconds, so it expires no later.
+        """
+        encoded = json.dumps(data, default=json_default)
+        size = len(encoded)
+        if size > self.max_bytes:
+            logger.warning(f"Not caching key {key}: {size} bytes exceeds the cache budget")
+            return
+
+        timestamp = datetime.now() - timedelta(seconds=age)
+        with self._lock:
+            self._insert(key, timestamp, data, size, meta)
+
+        if self.store is not None:
+            CACHE_WRITER.submit(
+                self._save, self.store, key, timestamp, encoded, json.dumps(meta) if meta is not None else None
+            )
+
+    def _save(self, store: SQLiteCacheStore, key: str, timestamp: datetime, data: str, meta: Optional[str]) -> None:
+        """Write an entry to the store, on the cache writer thread"""
+        try:
+            store.save(key, timestamp, self.ttl + self.grace, data, meta)
+        except sqlite3.Error as e:
+            logger.error(f"Error saving key {key} to persistent cache: {str(e)}")
+
+    def purge_expired(self) -> int:
+        """Remove all entries past their grace period and return how many were removed from memory"""
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if not self._is_retained(entry[0])]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+
+        if self.store is not None:
+            try:
+                self.store.purge_expired()
+            except sqlite3.Error as e:
+                logger.error(f"Error purging persistent cache: {str(e)}")
+        return len(expired)
+
+    def warm(self) -> int:
+        """Load the most recent unexpired entries from the store into memory"""
+        if self.store is None:
+            return 0
+
+        rows = self.store.load_recent(self.max_entries)
+        decoded = [(key, timestamp, self.decode(json.loads(data)), len(data), json.loads(meta) if meta else None)
+                   for key, timestamp, data, meta in rows]
+        with self._lock:
+            for key, timestamp, data, size, meta in decoded:
+                self._insert(key, timestamp, data, size, meta)
+        return len(rows)
+
+    def flush(self) -> None:
+        """Wait until the writes queued so far have reached the store"""
+        CACHE_WRITER.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Close the backing store, if any, once the writes queued before have reached it"""
+        if self.store is not None:
+            store, self.store = self.store, None
+            CACHE_WRITER.submit(store.close).result()
+
+    def snapshot(self) -> List[Tuple[str, datetime, Any]]:
+        """Get a snapshot of (key, timestamp, meta) for all entries"""
+        with self._lock:
+            return [(key, entry[0], entry[3]) for key, entry in self._entries.items()]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get size and hit/miss/eviction counters"""
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "persistent": self.store is not None,
+            }
+
+# Single thread writing to the cache stores, so writes never block the event loop and land in order
+CACHE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-writer")
+
+def create_cache_store(table: str) -> Optional[SQLiteCacheStore]:
+    """Open the persistent store for a cache table, if a cache database is configured"""
+    if not CACHE_DB_PATH:
+        return None
     try:
-        logger.info("Starting background cache refresh")
+        return SQLiteCacheStore(CACHE_DB_PATH, table)
+    except sqlite3.Error as e:
+        logger.error(f"Could not open persistent cache at {CACHE_DB_PATH}, using memory only: {str(e)}")
+        return None
 
-        # Check all cache entries
-        for cache_key, cache_entry in list(JOB_CACHE.items()):
+# Cache for job recommendations
+JOB_CACHE = JobCache(
+    CACHE_MAX_ENTRIES,
+    CACHE_MAX_BYTES,
+    CACHE_DURATION,
+    create_cache_store("recommendations"),
+    grace=CACHE_STALE_GRACE,
+    decode=decode_cached_jobs
+)
+
+# Lower-tier cache of parsed job lists per job board and search query, shared across recommendations
+SOURCE_CACHE_MAX_ENTRIES = int(os.environ.get("JOB_SCRAPER_SOURCE_CACHE_MAX_ENTRIES", "5000"))
+SOURCE_CACHE_MAX_BYTES = int(os.environ.get("JOB_SCRAPER_SOURCE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+SOURCE_CACHE = JobCache(
+    SOURCE_CACHE_MAX_ENTRIES,
+    SOURCE_CACHE_MAX_BYTES,
+    CACHE_DURATION,
+    create_cache_store("source_jobs"),
+    decode=decode_cached_jobs
+)
+
+# Parsed jobs per results page, with the page's validators and content hash, kept to revalidate pages on refresh
+PAGE_CACHE_TTL = timedelta(seconds=float(os.environ.get("JOB_SCRAPER_PAGE_CACHE_TTL", str(24 * 3600))))
+PAGE_CACHE_MAX_ENTRIES = int(os.environ.get("JOB_SCRAPER_PAGE_CACHE_MAX_ENTRIES", "5000"))
+PAGE_CACHE_MAX_BYTES = int(os.environ.get("JOB_SCRAPER_PAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+PAGE_CACHE = JobCache(
+    PAGE_CACHE_MAX_ENTRIES,
+    PAGE_CACHE_MAX_BYTES,
+    PAGE_CACHE_TTL,
+    create_cache_store("pages"),
+    decode=decode_cached_jobs
+)
+PAGE_CACHE_STATS = {"parsed": 0, "not_modified": 0, "unchanged": 0}
+
+# Per job board request rate limits and circuit breakers
+SOURCE_REQUESTS_PER_MINUTE = float(os.environ.get("JOB_SCRAPER_SOURCE_REQUESTS_PER_MINUTE", "60"))  # Sustained rate per board
+SOURCE_BURST = float(os.environ.get("JOB_SCRAPER_SOURCE_BURST", "10"))  # Requests a board may get at once
+SOURCE_RATE_LIMIT_WAIT = float(os.environ.get("JOB_SCRAPER_SOURCE_RATE_LIMIT_WAIT", "2"))  # Seconds to wait for a request slot
+CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("JOB_SCRAPER_CIRCUIT_FAILURE_THRESHOLD", "5"))  # Consecutive failures that open a circuit
+CIRCUIT_RESET_TIMEOUT = float(os.environ.get("JOB_SCRAPER_CIRCUIT_RESET_TIMEOUT", "30"))  # Seconds before probing an open circuit
+
+# Retries of transient upstream errors, with full-jitter exponential backoff, and hedged requests
+RETRY_ATTEMPTS = int(os.environ.get("JOB_SCRAPER_RETRY_ATTEMPTS", "2"))  # Retries after the first attempt
+RETRY_BASE_DELAY = float(os.environ.get("JOB_SCRAPER_RETRY_BASE_DELAY", "0.25"))  # Seconds, doubled on every retry
+RETRY_MAX_DELAY = float(os.environ.get("JOB_SCRAPER_RETRY_MAX_DELAY", "2"))  # Seconds, upper bound of a backoff
+HEDGE_REQUESTS = os.environ.get("JOB_SCRAPER_HEDGE_REQUESTS", "0") == "1"  # Send a second fetch when the first is slow
+HEDGE_PERCENTILE = 0.95  # A fetch slower than this share of recent ones is hedged
+HEDGE_MIN_SAMPLES = 20  # Recent latencies needed before hedging a board
+LATENCY_WINDOW = 200  # Recent latencies kept per board
+
+# Background cache maintenance
+REFRESH_CONCURRENCY = int(os.environ.get("JOB_SCRAPER_REFRESH_CONCURRENCY", "4"))  # Refreshes running at once
+REFRESH_JITTER = float(os.environ.get("JOB_SCRAPER_REFRESH_JITTER", "5"))  # Max random delay in seconds before a refresh
+CACHE_PURGE_INTERVAL = float(os.environ.get("JOB_SCRAPER_CACHE_PURGE_INTERVAL", "300"))  # Seconds between cache purges
+
+# Popularity-driven prefetching of hot recommendation queries
+POPULARITY_HALF_LIFE = float(os.environ.get("JOB_SCRAPER_POPULARITY_HALF_LIFE", "3600"))  # Seconds for an access to lose half its weight
+PREFETCH_TOP_N = int(os.environ.get("JOB_SCRAPER_PREFETCH_TOP_N", "20"))  # Hottest queries kept warm
+PREFETCH_REQUESTS_PER_MINUTE = float(os.environ.get("JOB_SCRAPER_PREFETCH_REQUESTS_PER_MINUTE", "30"))  # Upstream budget
+PREFETCH_INTERVAL = float(os.environ.get("JOB_SCRAPER_PREFETCH_INTERVAL", "60"))  # Seconds between prefetch passes
+
+# Live requests and background revalidations of the same cache key share one computation
+RECOMMENDATION_FLIGHTS = SingleFlight("recommendations")
+
+# Spellings of experience levels that mean the same thing
+EXPERIENCE_LEVEL_ALIASES = {
+    "jr": "junior",
+    "entry": "junior",
+    "entry level": "junior",
+    "entry-level": "junior",
+    "intermediate": "mid",
+    "mid level": "mid",
+    "mid-level": "mid",
+    "sr": "senior",
+}
+
+def normalize_skills(skills: str) -> Tuple[str, ...]:
+    """Split a comma-separated skill list into lowercased, trimmed, deduplicated, sorted skills"""
+    return tuple(sorted({" ".join(skill.split()).lower() for skill in skills.split(",") if skill.strip()}))
+
+def normalize_experience_level(experience_level: Optional[str]) -> Optional[str]:
+    """Lowercase and trim an experience level, mapping known aliases to one spelling"""
+    if not experience_level or not experience_level.strip():
+        return None
+    level = " ".join(experience_level.split()).lower().rstrip(".")
+    return EXPERIENCE_LEVEL_ALIASES.get(level, level)
+
+@dataclass(frozen=True)
+class RecommendationQuery:
+    """Canonical form of a recommendations request, shared by cache lookups and refreshes"""
+    skills: Tuple[str, ...]
+    experience_level: Optional[str]
+    limit: int
+
+    @classmethod
+    def from_params(cls, skills: str, experience_level: Optional[str], limit: int) -> "RecommendationQuery":
+        """Build the canonical query from raw request parameters"""
+        return cls(normalize_skills(skills), normalize_experience_level(experience_level), limit)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RecommendationQuery":
+        """Rebuild a query stored with to_dict"""
+        return cls(tuple(data["skills"]), data["experience_level"], data["limit"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the query"""
+        return {"skills": list(self.skills), "experience_level": self.experience_level, "limit": self.limit}
+
+    @property
+    def skills_param(self) -> str:
+        """Skills as a comma-separated string"""
+        return ",".join(self.skills)
+
+    @property
+    def cache_key(self) -> str:
+        """Compact, hashed cache key"""
+        canonical = json.dumps([self.skills, self.experience_level, self.limit], separators=(",", ":"))
+        return "rec:" + hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:20]
+
+def get_source_cache_key(source: str, query: str, location: Optional[str]) -> str:
+    """Generate a cache key for one job board's results for a search query and location"""
+    canonical_query = " ".join(query.split()).lower()
+    canonical_location = " ".join(location.split()).lower() if location else ""
+    return f"{source}|{canonical_query}|{canonical_location}"
+
+async def get_cached_source_jobs(
+    source: str,
+    query: str,
+    location: Optional[str],
+    limit: int
+) -> Optional[Tuple[List[JobRecord], float]]:
+    """Get cached jobs from one job board and their age in seconds, if the cached scrape asked for at least `limit` jobs"""
+    cached = await SOURCE_CACHE.lookup_async(get_source_cache_key(source, query, location), allow_stale=False)
+    if cached is None or cached[0]["limit"] < limit:
+        return None
+    return cached[0]["jobs"][:limit], cached[1]
+
+def set_cached_source_jobs(source: str, query: str, location: Optional[str], limit: int, jobs: List[JobRecord]) -> None:
+    """Cache jobs scraped from one job board"""
+    SOURCE_CACHE.set(get_source_cache_key(source, query, location), {"limit": limit, "jobs": jobs})
+
+async def get_cached_jobs(cache_key: str) -> Optional[Tuple[Dict[str, Any], float, bool]]:
+    """Get cached job recommendations as (data, age in seconds, stale)"""
+    cached = await JOB_CACHE.lookup_async(cache_key)
+    if cached is not None:
+        state = "stale" if cached[2] else "cached"
+        logger.info(f"Using {state} job recommendations for key: {cache_key}")
+    return cached
+
+def set_cached_jobs(
+    cache_key: str,
+    data: Dict[str, Any],
+    query: Optional[RecommendationQuery] = None,
+    age: float = 0.0
+) -> None:
+    """
+    Cache job recommendations, remembering the query so the entry can be refreshed
+
+    Results missing job boards that were skipped, because their circuit was
+    open or their rate limit reached, are not cached. Those boards are usually
+    back within seconds, and the boards that did answer are in SOURCE_CACHE.
+    """
+    if data.get("skipped_sources"):
+        logger.info(f"Not caching job recommendations for key {cache_key}, skipped sources: {data['skipped_sources']}")
+        return
+    JOB_CACHE.set(cache_key, data, meta=query.to_dict() if query is not None else None, age=age)
+    logger.info(f"Cached job recommendations for key: {cache_key}")
+
+class ResultAge:
+    """
+    Age of the oldest cached result a response is built from
+
+    A response assembled from cached per-board results is only as fresh as
+    the oldest of them, so it is cached and reported with that age.
+    """
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Account for a cached result of the given age"""
+        self.seconds = max(self.seconds, seconds)
+
+class PopularityTracker:
+    """
+    Exponentially decayed access counts per recommendation query
+
+    Every access adds one to the query's score, and scores halve every
+    half_life seconds, so the hottest queries are the ones requested most
+    often recently. Queries whose score decays below min_score are forgotten,
+    and at most max_tracked queries are kept.
+    """
+
+    def __init__(self, half_life: float, max_tracked: int, min_score: float = 0.05):
+        self.half_life = half_life
+        self.max_tracked = max_tracked
+        self.min_score = min_score
+        # Structure: {cache_key: [score, last_update, query]}
+        self._scores: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _decayed(self, score: float, last_update: float, now: float) -> float:
+        return score * math.pow(0.5, (now - last_update) / self.half_life)
+
+    def record(self, query: RecommendationQuery) -> None:
+        """Count one access to the query"""
+        now = time.monotonic()
+        with self._lock:
+            tracked = self._scores.get(query.cache_key)
+            if tracked is None:
+                self._scores[query.cache_key] = [1.0, now, query]
+            else:
+                tracked[0] = self._decayed(tracked[0], tracked[1], now) + 1.0
+                tracked[1] = now
+
+    def hottest(self, n: int) -> List[Tuple[RecommendationQuery, float]]:
+        """Get the n queries with the highest decayed scores, forgetting cold ones"""
+        now = time.monotonic()
+        with self._lock:
+            ranked = []
+            for cache_key, (score, last_update, query) in list(self._scores.items()):
+                current = self._decayed(score, last_update, now)
+                if current < self.min_score:
+                    del self._scores[cache_key]
+                else:
+                    ranked.append((current, cache_key, query))
+            ranked.sort(key=lambda item: item[0], reverse=True)
+
+            for _, cache_key, _ in ranked[self.max_tracked:]:
+                del self._scores[cache_key]
+            return [(query, score) for score, _, query in ranked[:n]]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of tracked queries"""
+        with self._lock:
+            return {"tracked": len(self._scores)}
+
+# Access counts for recommendation queries, used to decide what to prefetch
+POPULARITY = PopularityTracker(POPULARITY_HALF_LIFE, max_tracked=max(PREFETCH_TOP_N * 10, 100))
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate up to a burst capacity"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if enough are available"""
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def available(self) -> float:
+        """Get the number of tokens currently available"""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Get the seconds until enough tokens will be available"""
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate) if self.rate > 0 else math.inf
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream that keeps failing, and probes it to detect recovery
+
+    The breaker opens after `failure_threshold` consecutive failures and then
+    rejects calls until `reset_timeout` has passed. It then turns half open and
+    lets a single probe through: success closes it, failure opens it again. A
+    probe that never reports back is replaced after another `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self.last_failure: Optional[str] = None
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check if a call may go through, claiming the probe when half open"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == "open" and now - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._probe_started = None
+            if self.state == "half_open":
+                if self._probe_started is None or now - self._probe_started >= self.reset_timeout:
+                    self._probe_started = now
+                    return True
+            if self.state == "closed":
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Report a successful call, closing the breaker"""
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._probe_started = None
+
+    def record_failure(self, reason: str) -> None:
+        """Report a failed call, opening the breaker after too many in a row or a failed probe"""
+        with self._lock:
+            self.failures += 1
+            self.last_failure = reason
+            if self.state == "half_open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+                self.state = "open"
+                self.opened += 1
+                self._opened_at = time.monotonic()
+                self._probe_started = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the breaker's state and counters"""
+        with self._lock:
+            retry_in = self.reset_timeout - (time.monotonic() - self._opened_at) if self.state == "open" else 0.0
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "last_failure": self.last_failure,
+                "times_opened": self.opened,
+                "rejected": self.rejected,
+                "retry_in_seconds": round(max(0.0, retry_in), 1),
+            }
+
+class LatencyTracker:
+    """Keeps the most recent latencies of an upstream to estimate its percentiles"""
+
+    def __init__(self, size: int):
+        self._samples: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample"""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float, min_samples: int = 1) -> Optional[float]:
+        """Get a latency percentile, or None with fewer than `min_samples` samples"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < max(1, min_samples):
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the sample count and median and 95th percentile latencies"""
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "samples": len(self._samples),
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "p95_seconds": round(p95, 3) if p95 is not None else None,
+        }
+
+# Upstream requests prefetching may spend, refilled continuously up to one minute's worth
+PREFETCH_BUDGET = TokenBucket(PREFETCH_REQUESTS_PER_MINUTE / 60, PREFETCH_REQUESTS_PER_MINUTE)
+
+def prefetch_hot_queries() -> int:
+    """
+    Schedule refreshes for the hottest queries that will expire before the next pass
+
+    Each refresh is charged one upstream request per skill and job board
+    against PREFETCH_BUDGET, and is skipped when the budget can't cover it.
+    Queries outside the top N are left to expire. Returns the number of
+    refreshes scheduled.
+    """
+    ttl = CACHE_DURATION.total_seconds()
+    scheduled = 0
+
+    for query, score in POPULARITY.hottest(PREFETCH_TOP_N):
+        age = JOB_CACHE.age(query.cache_key)
+        remaining_ttl = ttl - age if age is not None else 0.0
+        if remaining_ttl > PREFETCH_INTERVAL + REFRESH_JITTER:
+            continue
+
+        # Charge the most upstream requests the refresh can make, every results page of every board
+        pages_per_skill = sum(extractor.max_pages for extractor in EXTRACTORS.values())
+        if not PREFETCH_BUDGET.try_acquire(len(query.skills) * pages_per_skill):
+            continue
+
+        # Refresh shortly before the entry expires, jitter included
+        REFRESH_SCHEDULER.schedule(query, delay=max(0.0, remaining_ttl - REFRESH_JITTER), popularity=max(1, round(score)))
+        scheduled += 1
+
+    if scheduled:
+        logger.info(f"Scheduled prefetch of {scheduled} hot queries")
+    return scheduled
+
+def purge_caches() -> None:
+    """Drop cache entries past their grace period so they stop counting against the cache budget"""
+    for name, cache in (("recommendation", JOB_CACHE), ("source", SOURCE_CACHE), ("page", PAGE_CACHE)):
+        purged = cache.purge_expired()
+        if purged:
+            logger.info(f"Purged {purged} expired {name} cache entries")
+
+    if JOB_INDEX is not None:
+        try:
+            purged = JOB_INDEX.purge()
+            if purged:
+                logger.info(f"Purged {purged} job listings not seen recently from the job index")
+        except sqlite3.Error as e:
+            logger.error(f"Error purging job index: {str(e)}")
+
+class RefreshScheduler:
+    """
+    Runs background cache refreshes on the app's event loop
+
+    Refreshes wait in a priority queue ordered by when they are due, then by
+    how many times they were requested while queued. A fixed number of workers
+    bounds how many run at once, and a random jitter is added to every due
+    time so refreshes requested together don't hit the job boards together.
+    The scheduler also purges expired cache entries and prefetches hot queries
+    periodically.
+    """
+
+    def __init__(self, concurrency: int, jitter: float, purge_interval: float):
+        self.concurrency = concurrency
+        self.jitter = jitter
+        self.purge_interval = purge_interval
+        self.completed = 0
+        self.failed = 0
+        # Structure: {cache_key: [due_at, popularity, query]}
+        self._pending: Dict[str, list] = {}
+        # Heap of (due_at, -popularity, sequence, cache_key); outdated items are skipped when popped
+        self._heap: List[Tuple[float, int, int, str]] = []
+        self._sequence = itertools.count()
+        self._running: set = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def schedule(self, query: RecommendationQuery, delay: float = 0.0, popularity: int = 1) -> None:
+        """Queue a refresh of the query's cache entry, or bump its popularity if already queued"""
+        cache_key = query.cache_key
+        if cache_key in self._running or RECOMMENDATION_FLIGHTS.in_flight(cache_key):
+            return
+
+        due_at = asyncio.get_running_loop().time() + delay + random.uniform(0, self.jitter)
+        pending = self._pending.get(cache_key)
+        if pending is None:
+            pending = [due_at, 0, query]
+            self._pending[cache_key] = pending
+            logger.info(f"Scheduled refresh for key: {cache_key}")
+        pending[0] = min(pending[0], due_at)
+        pending[1] += popularity
+        heapq.heappush(self._heap, (pending[0], -pending[1], next(self._sequence), cache_key))
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _next(self) -> Tuple[str, RecommendationQuery]:
+        """Wait for the next due refresh"""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Skip heap items superseded by a later popularity bump
+            while self._heap:
+                due_at, negative_popularity, _, cache_key = self._heap[0]
+                pending = self._pending.get(cache_key)
+                if pending is not None and pending[0] == due_at and pending[1] == -negative_popularity:
+                    break
+                heapq.heappop(self._heap)
+
+            timeout = None
+            if self._heap:
+                due_at, _, _, cache_key = self._heap[0]
+                if due_at <= loop.time():
+                    heapq.heappop(self._heap)
+                    return cache_key, self._pending.pop(cache_key)[2]
+                timeout = due_at - loop.time()
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _worker(self) -> None:
+        while True:
+            cache_key, query = await self._next()
+            self._running.add(cache_key)
             try:
-                cache_time = cache_entry["timestamp"]
-                now = datetime.now()
-
-                # If cache is about to expire (80% of cache duration), refresh it
-                if now - cache_time > CACHE_DURATION * 0.8:
-                    logger.info(f"Refreshing cache for key: {cache_key}")
-
-                    # Parse the cache key to get parameters
-                    parts = cache_key.split("_")
-                    if len(parts) >= 3:
-                        skills = parts[0]
-                        experience_level = parts[1] if parts[1] != "None" else None
-                        limit = int(parts[2])
-
-                        # Start a thread to refresh this cache entry
-                        threading.Thread(
-                            target=refresh_cache_entry,
-                            args=(skills, experience_level, limit, cache_key),
-                            daemon=True
-                        ).start()
+                await load_job_recommendations(query, force_refresh=True)
+                self.completed += 1
+                logger.info(f"Successfully refreshed cache for key: {cache_key}")
             except Exception as e:
-                logger.error(f"Error checking cache entry {cache_key}: {str(e)}")
+                self.failed += 1
+                logger.error(f"Error refreshing cache for key {cache_key}: {str(e)}")
+            finally:
+                self._running.discard(cache_key)
+
+    async def _purge_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.purge_interval)
+            try:
+                # SQLite deletes can block, so keep them off the event loop
+                await asyncio.to_thread(purge_caches)
+            except Exception as e:
+                logger.error(f"Error in background cache purge: {str(e)}")
 
-    except Exception as e:
-        logger.error(f"Error in background cache refresh: {str(e)}")
-    finally:
-        BACKGROUND_REFRESH_RUNNING = False
+    async def _prefetch_loop(self) -> None:
+        while True:
+            await asyncio.sleep(PREFETCH_INTERVAL)
+            try:
+                prefetch_hot_queries()
+            except Exception as e:
+                logger.error(f"Error prefetching hot queries: {str(e)}")
+
+    def start(self) -> None:
+        """Start the workers, the purge loop and the prefetch loop on the running event loop"""
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._purge_loop()))
+        self._tasks.append(asyncio.create_task(self._prefetch_loop()))
+        logger.info(f"Started refresh scheduler with {self.concurrency} workers")
+
+    async def stop(self) -> None:
+        """Cancel the workers and background loops, dropping queued refreshes"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._wakeup = None
+        self._pending.clear()
+        self._heap.clear()
+        logger.info("Stopped refresh scheduler")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue and counter state"""
+        return {
+            "running": bool(self._tasks),
+            "queued": len(self._pending),
+            "in_progress": len(self._running),
+            "completed": self.completed,
+            "failed": self.failed,
+        }
 
-        # Schedule next run in 5 minutes
-        threading.Timer(300, background_refresh_cache).start()
+REFRESH_SCHEDULER = RefreshScheduler(REFRESH_CONCURRENCY, REFRESH_JITTER, CACHE_PURGE_INTERVAL)
 
-def refresh_cache_entry(skills: str, experience_level: Optional[str], limit: int, cache_key: str):
-    """Refresh a specific cache entry"""
-    try:
-        # Create event loop for async function
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        # Call the recommendations function
-        result = loop.run_until_complete(
-            get_job_recommendations_internal(skills, experience_level, limit)
-        )
+def schedule_revalidation(query: RecommendationQuery) -> None:
+    """Refresh a stale cache entry in the background, unless it is already being refreshed"""
+    REFRESH_SCHEDULER.schedule(query)
 
-        # Update cache
-        set_cached_jobs(cache_key, result)
-        logger.info(f"Successfully refreshed cache for key: {cache_key}")
-    except Exception as e:
-        logger.error(f"Error refreshing cache for key {cache_key}: {str(e)}")
+def with_freshness(data: Dict[str, Any], age: float, stale: bool, cached: bool = True) -> Dict[str, Any]:
+    """Add a freshness indicator to a recommendations response without touching the cached data"""
+    return {
+        **data,
+        "freshness": {
+            "cached": cached,
+            "stale": stale,
+            "age_seconds": round(age, 1),
+        }
+    }
+
+async def load_job_recommendations(query: RecommendationQuery, force_refresh: bool = False) -> Tuple[Dict[str, Any], float]:
+    """
+    Get job recommendations and cache them, sharing the work with concurrent callers
+
+    Returns the result and its age in seconds, which is that of the oldest
+    cached per-board results it was built from. Refreshes force every board
+    to be scraped again, so they never rebuild an entry from the cached results
+    it was built from in the first place.
+    """
+    async def load():
+        age = ResultAge()
+        result = await get_job_recommendations_internal(
+            query.skills_param, query.experience_level, query.limit, force_refresh=force_refresh, age=age
+        )
+        set_cached_jobs(query.cache_key, result, query, age=age.seconds)
+        return result, age.seconds
 
-# Start background cache refresh
-threading.Timer(60, background_refresh_cache).start()
+    return await RECOMMENDATION_FLIGHTS.do(query.cache_key, load)
 
 # User agent list to rotate for requests
 USER_AGENTS = [
@@ -160,672 +1371,1875 @@ def get_random_headers():
 def read_root():
     return {"status": "Job Scraper API is running"}
 
-async def scrape_simplyhired(query: str, location: Optional[str], limit: int) -> List[Dict[str, Any]]:
-    """Scrape SimplyHired for job listings"""
-    logger.info(f"Scraping SimplyHired for '{query}' in '{location}'")
-
-    # Format query for URL
-    formatted_query = query.replace(" ", "-")
-    url_location = "" if not location else f"&l={location.replace(' ', '-')}"
+@app.get("/api/jobs/stats")
+def get_stats():
+    """Get counters for the scraper's caches and request coalescing"""
+    return {
+        "single_flight": {
+            "scrapes": SCRAPE_FLIGHTS.stats(),
+            "recommendations": RECOMMENDATION_FLIGHTS.stats(),
+        },
+        "recommendation_cache": JOB_CACHE.stats(),
+        "source_cache": SOURCE_CACHE.stats(),
+        "page_cache": {**PAGE_CACHE.stats(), **PAGE_CACHE_STATS},
+        "refresh_scheduler": REFRESH_SCHEDULER.stats(),
+        "popularity": {
+            **POPULARITY.stats(),
+            "prefetch_budget": round(PREFETCH_BUDGET.available(), 1),
+        },
+        "job_index": JOB_INDEX.stats() if JOB_INDEX is not None else None,
+        "streaming": dict(STREAM_STATS),
+        "parser": {
+            "backend": HTML_PARSER_BACKEND,
+            "executor": PARSE_EXECUTOR_KIND,
+            "workers": PARSE_WORKERS if PARSE_EXECUTOR_KIND != "inline" else 0,
+        },
+    }
 
-    url = f"https://www.simplyhired.com/search?q={formatted_query}{url_location}"
-    logger.info(f"Scraping URL: {url}")
+# HTML parser used by BeautifulSoup: "auto" picks lxml when installed, else the pure-Python html.parser
+HTML_PARSER = os.environ.get("JOB_SCRAPER_HTML_PARSER", "auto")
 
+def select_html_parser(preference: str) -> str:
+    """Pick the BeautifulSoup parser backend, preferring the C-accelerated lxml"""
+    if preference != "auto":
+        return preference
     try:
-        # Make the request with random headers
-        response = requests.get(url, headers=get_random_headers(), timeout=15)
-        response.raise_for_status()
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+HTML_PARSER_BACKEND = select_html_parser(HTML_PARSER)
+logger.info(f"Using HTML parser backend: {HTML_PARSER_BACKEND}")
+
+# First compound of a CSS selector: tag name, classes and an optional [attr] or [attr="value"]
+SELECTOR_COMPOUND_PATTERN = re.compile(r'^([a-zA-Z][\w-]*)?((?:\.[\w-]+)*)(?:\[([\w-]+)(?:="([^"]*)")?\])?')
+
+def parse_selector_compound(selector: str) -> Tuple[Tuple[Optional[str], set, Optional[str], Optional[str]], bool]:
+    """Split the first compound of a selector into a rule, and tell whether it is the whole selector"""
+    selector = selector.strip()
+    match = SELECTOR_COMPOUND_PATTERN.match(selector)
+    tag, classes, attr, value = match.groups()
+    rule = (tag, set(classes.split(".")[1:]) if classes else set(), attr, value)
+    return rule, match.end() == len(selector)
+
+def compound_matches(rule: Tuple[Optional[str], set, Optional[str], Optional[str]], name: str, attrs: Dict[str, Any]) -> bool:
+    """Check if a tag with the given name and attributes matches a compound rule"""
+    tag, required_classes, attr, value = rule
+    if tag and tag != name:
+        return False
+    raw_classes = attrs.get("class") or ""
+    classes = set(raw_classes.split() if isinstance(raw_classes, str) else raw_classes)
+    if not required_classes <= classes:
+        return False
+    if attr and (attr not in attrs or (value is not None and attrs[attr] != value)):
+        return False
+    return True
 
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-        job_listings = []
+class CardStrainer(SoupStrainer):
+    """
+    Parse-time filter that only builds the subtrees that can hold job cards
 
-        # Log the HTML structure to help with debugging
-        logger.info("Parsing SimplyHired HTML response...")
+    Each card selector contributes a rule for its first compound (tag, classes
+    and attribute), so a top-level element is kept when it could be, or could
+    contain, a match for one of the selectors. Everything else on the page,
+    including text between cards, is skipped without creating Tag objects.
+    """
+
+    def __init__(self, selectors: Tuple[str, ...]):
+        super().__init__()
+        self.rules = [parse_selector_compound(selector)[0] for selector in selectors]
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict[str, Any]]) -> bool:
+        attrs = attrs or {}
+        return any(compound_matches(rule, name, attrs) for rule in self.rules)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
 
-        # Try multiple selectors for job cards
-        job_cards = []
-        selectors = [
+@lru_cache(maxsize=32)
+def get_card_strainer(selectors: Tuple[str, ...]) -> CardStrainer:
+    """Build the card strainer for a selector list once and reuse it"""
+    return CardStrainer(selectors)
+
+# Bytes of an unfinished tag kept between chunks; a longer one is not a job card
+CARD_SCAN_MAX_TAG_BYTES = 64 * 1024
+CARD_SCAN_ATTRIBUTE = re.compile(rb'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+CARD_SCAN_CLOSERS = {
+    b"!--": re.compile(rb"-->"),
+    b"script": re.compile(rb"</script\s*>", re.IGNORECASE),
+    b"style": re.compile(rb"</style\s*>", re.IGNORECASE),
+}
+
+@lru_cache(maxsize=32)
+def card_scan_pattern(tag: Optional[str]) -> "re.Pattern[bytes]":
+    """Build the regex finding comments, scripts, styles and the start and end tags a card counter watches"""
+    name = re.escape(tag.encode("ascii")) if tag else rb"[a-z][a-z0-9:-]*"
+    return re.compile(rb"<(?:(!--)|(script|style)\b|(/?)(" + name + rb")(?=[\s/>])([^>]*)>)", re.IGNORECASE)
+
+class CardCounter:
+    """
+    Incremental byte scanner that counts complete job cards while a page downloads
+
+    It watches a single card selector, which must be a plain compound such as
+    "div.job_seen_beacon", and tracks nesting of that tag name to know when a
+    card has closed. Once `limit` cards are complete, the first `limit`
+    matches of the selector are all in the bytes read so far, since a card
+    still downloading comes after them in document order. A precompiled regex
+    finds only the tags of that name, plus comments, scripts and styles to
+    skip, so every other byte of the page is scanned in C; attributes are
+    only decoded for start tags outside a card.
+    """
+
+    def __init__(self, index: int, rule: Tuple[Optional[str], set, Optional[str], Optional[str]], limit: int):
+        self.index = index
+        self.rule = rule
+        self.limit = limit
+        self.complete = 0
+        # Bytes into the body where the limit-th card ends, once it has, if the body is scanned as is
+        self.end: Optional[int] = None
+        self._fed = 0
+        self._pattern = card_scan_pattern(rule[0])
+        self._encoding: Optional[str] = None
+        self._decoder = None
+        self._pending = b""
+        self._closer: Optional["re.Pattern[bytes]"] = None
+        self._tag: Optional[bytes] = None
+        self._depth = 0
+
+    def fresh(self) -> "CardCounter":
+        """Get an unused counter for the same selector, for another download of the page"""
+        return CardCounter(self.index, self.rule, self.limit)
+
+    def _matches(self, name: bytes, attrs: bytes) -> bool:
+        values = {}
+        for match in CARD_SCAN_ATTRIBUTE.finditer(attrs):
+            value = match.group(2) or match.group(3) or match.group(4) or b""
+            values[match.group(1).decode(self._encoding, "replace").lower()] = unescape(value.decode(self._encoding, "replace"))
+        return compound_matches(self.rule, name.decode("ascii").lower(), values)
+
+    def _scan(self, data: bytes, offset: int) -> None:
+        pos = 0
+        while self.complete < self.limit:
+            if self._closer is not None:
+                match = self._closer.search(data, pos)
+                if match is None:
+                    # Keep enough bytes to find a closing tag split across chunks
+                    self._pending = data[max(pos, len(data) - 16):]
+                    return
+                pos = match.end()
+                self._closer = None
+                continue
+
+            match = self._pattern.search(data, pos)
+            if match is None:
+                break
+            pos = match.end()
+            comment, raw_text, closing, name, attrs = match.groups()
+            if comment or raw_text:
+                self._closer = CARD_SCAN_CLOSERS[(comment or raw_text).lower()]
+            elif self._tag is not None:
+                if name.lower() == self._tag:
+                    self._depth += -1 if closing else 1
+                    if self._depth == 0:
+                        self._tag = None
+                        self.complete += 1
+                        if self.complete == self.limit and self._decoder is None:
+                            self.end = offset + pos
+            elif not closing and self._matches(name, attrs):
+                self._tag = name.lower()
+                self._depth = 1
+
+        # Keep a tag that is still arriving, so it is scanned whole with the next chunk
+        start = data.rfind(b"<", pos)
+        if start != -1 and data.find(b">", start) == -1 and len(data) - start <= CARD_SCAN_MAX_TAG_BYTES:
+            self._pending = data[start:]
+        else:
+            self._pending = b""
+
+    def feed_chunk(self, chunk: bytes, encoding: str) -> bool:
+        """Scan the next chunk of the body, and return whether enough cards are complete"""
+        if self._encoding is None:
+            self._encoding = encoding
+            # Tags are matched as ASCII bytes, so other encodings such as UTF-16 are scanned as UTF-8
+            if "<div>".encode(encoding) != b"<div>":
+                self._encoding = "utf-8"
+                self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        if self._decoder is not None:
+            chunk = self._decoder.decode(chunk).encode("utf-8")
+        if self.complete < self.limit:
+            offset = self._fed - len(self._pending)
+            self._fed += len(chunk)
+            self._scan(self._pending + chunk, offset)
+        return self.complete >= self.limit
+
+SELECTOR_DEMOTE_AFTER = int(os.environ.get("JOB_SCRAPER_SELECTOR_DEMOTE_AFTER", "10"))  # Misses in a row before a selector is tried last
+
+class SelectorMemory:
+    """
+    Remembers which of an ordered list of selectors stopped matching, so they are not tried first
+
+    Selectors are tried in spec order, except that one which missed
+    SELECTOR_DEMOTE_AFTER times in a row is moved after the others until it
+    matches again. Specs list narrow selectors before broader ones that can
+    match the same element, so a broad selector only moves ahead of a narrow
+    one once the board has dropped the narrow one, never because of a single
+    unusual card. Board markup is stable for days, so the first selector
+    tried almost always matches. Fallback selectors, such as any link in a
+    card, always come last in spec order, since they also match elements the
+    specific selectors would rightly skip.
+    """
+
+    def __init__(self, selectors: List[str], fallbacks: List[str] = ()):
+        self.selectors = list(selectors) + list(fallbacks)
+        self.specific = len(selectors)
+        self.compiled = [soupsieve.compile(selector) for selector in self.selectors]
+        self.hits = [0] * len(self.selectors)
+        self.misses = [0] * len(self.selectors)
+        # Misses since each selector last matched
+        self.streaks = [0] * len(self.selectors)
+        # Indexes into selectors in the order to try them; replaced, never mutated, so readers need no lock
+        self.order = list(range(len(self.selectors)))
+        self.last_winner: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _reorder(self) -> None:
+        demoted = [i for i in range(self.specific) if self.streaks[i] >= SELECTOR_DEMOTE_AFTER]
+        active = [i for i in range(self.specific) if self.streaks[i] < SELECTOR_DEMOTE_AFTER]
+        order = active + demoted + list(range(self.specific, len(self.selectors)))
+        if order != self.order:
+            self.order = order
+
+    def record(self, index: int, count: int = 1, missed: Iterable[int] = ()) -> bool:
+        """
+        Count matches for the selector at index, and misses for the selectors
+        tried before it, and return whether it differs from the last one to match
+        """
+        with self._lock:
+            self.hits[index] += count
+            self.streaks[index] = 0
+            for other in missed:
+                self.misses[other] += 1
+                self.streaks[other] += 1
+            changed = index != self.last_winner
+            self.last_winner = index
+            self._reorder()
+            return changed
+
+    def counts(self) -> Dict[str, Any]:
+        """Get the raw counters, to carry the memory across processes"""
+        with self._lock:
+            return {
+                "hits": list(self.hits),
+                "misses": list(self.misses),
+                "streaks": list(self.streaks),
+                "last_winner": self.last_winner,
+            }
+
+    def merge_counts(self, before: Dict[str, Any], after: Dict[str, Any]) -> None:
+        """Apply what a copy of this memory counted between two snapshots of its counters"""
+        with self._lock:
+            for index in range(len(self.selectors)):
+                hits = after["hits"][index] - before["hits"][index]
+                misses = after["misses"][index] - before["misses"][index]
+                self.hits[index] += hits
+                self.misses[index] += misses
+                # A selector that matched in the copy has the copy's streak; otherwise its misses add to ours
+                self.streaks[index] = after["streaks"][index] if hits > 0 else self.streaks[index] + misses
+            if after["last_winner"] is not None and after["last_winner"] != before["last_winner"]:
+                self.last_winner = after["last_winner"]
+            self._reorder()
+
+    def state(self) -> Dict[str, Any]:
+        """Get the current order, match and miss counts and last matching selector"""
+        with self._lock:
+            return {
+                "last_winner": self.selectors[self.last_winner] if self.last_winner is not None else None,
+                "order": [self.selectors[i] for i in self.order],
+                "hits": {self.selectors[i]: self.hits[i] for i in range(len(self.selectors))},
+                "misses": {self.selectors[i]: self.misses[i] for i in range(len(self.selectors))},
+            }
+
+# Extraction specs for each job board, in the order their results are merged.
+# Each spec is plain data: how to build the search URL, the card selectors to
+# try in order, and for each job field its ordered selectors, generic fallback
+# selectors tried only after those, the attribute to read (text when absent),
+# a default, and post-processing steps applied to found values. Fields with a
+# "value" are constants that stand in for data the board does not show on its
+# results pages. Adding a board means adding a spec here.
+SITE_SPECS = {
+    "indeed": {
+        "source": "Indeed",
+        "search_url": "https://www.indeed.com/jobs?q={query}{location}&sort=date",
+        "location_param": "&l={location}",
+        "space": "+",
+        "page_param": "&start={offset}",
+        "page_size": 10,
+        # Indeed frequently changes their HTML structure
+        "cards": [
+            'div.job_seen_beacon',
+            'div.cardOutline',
+            'div.css-1m4cuuf',
+            'div.jobsearch-ResultsList > div',
+            'div[data-testid="job-card"]',
+            'div.tapItem'
+        ],
+        "fields": {
+            "title": {
+                "selectors": [
+                    'h2.jobTitle span', 'h2.jobTitle', 'a.jcs-JobTitle',
+                    'h2[data-testid="jobTitle"]', 'a[data-jk]', 'a.jobtitle'
+                ],
+                "fallbacks": ['h2 span', 'h2 a', 'span[title]'],
+                "default": "Unknown Title",
+            },
+            "company": {
+                "selectors": [
+                    'span.companyName', 'div.company_location a', 'span.company',
+                    'div.companyInfo a', 'span[data-testid="company-name"]',
+                    'div.company', 'span.company-name'
+                ],
+                "default": "Unknown Company",
+            },
+            "location": {
+                "selectors": [
+                    'div.companyLocation', 'span.location', 'div.location',
+                    'span[data-testid="location"]', 'div.recJobLoc'
+                ],
+                "default": "Unknown Location",
+            },
+            "salary": {
+                "selectors": [
+                    'div.salary-snippet', 'div.metadata.salary-snippet-container',
+                    'span.salaryText', 'div[data-testid="salary-snippet"]',
+                    'span.salary'
+                ],
+                "default": "Not specified",
+                "post": [["collapse_whitespace"]],
+            },
+            "type": {
+                "selectors": [
+                    'div.metadata span.attribute_snippet', 'span.jobType',
+                    'div[data-testid="attribute_snippet"]', 'div.job-types'
+                ],
+                "default": "Not specified",
+            },
+            "summary": {
+                "selectors": [
+                    'div.job-snippet', 'div.summary', 'div[data-testid="job-snippet"]',
+                    'div.snippet', 'span.summary'
+                ],
+                "default": "No description available",
+            },
+            "url": {
+                "selectors": ['h2.jobTitle a', 'a.jcs-JobTitle', 'a[data-jk]', 'a.jobtitle'],
+                "fallbacks": ['a[href*="clk"]'],
+                "attr": "href",
+                "default": "",
+                "post": [["prefix_url", "https://www.indeed.com"]],
+            },
+            # Indeed doesn't always show exact dates
+            "posted": {"value": "Recently"},
+        },
+    },
+    "linkedin": {
+        "source": "LinkedIn",
+        "search_url": "https://www.linkedin.com/jobs/search/?keywords={query}{location}&sortBy=DD",
+        "location_param": "&location={location}",
+        "space": "%20",
+        "page_param": "&start={offset}",
+        "page_size": 25,
+        # LinkedIn frequently changes their HTML structure
+        "cards": [
+            'div.base-card.relative',
+            'li.jobs-search-results__list-item',
+            'div.job-search-card',
+            'div.base-search-card',
+            'li.result-card',
+            'div.job-card-container'
+        ],
+        "fields": {
+            "title": {
+                "selectors": [
+                    'h3.base-search-card__title', 'h3.job-search-card__title',
+                    'h3.result-card__title', 'h3.base-card__title',
+                    'span.screen-reader-text', 'a.job-card-container__link'
+                ],
+                "default": "Unknown Title",
+            },
+            "company": {
+                "selectors": [
+                    'h4.base-search-card__subtitle', 'h4.job-search-card__subtitle',
+                    'h4.result-card__subtitle', 'a.job-card-container__company-name',
+                    'div.base-search-card__info a', 'span.company-name'
+                ],
+                "default": "Unknown Company",
+            },
+            "location": {
+                "selectors": [
+                    'span.job-search-card__location', 'div.job-search-card__location',
+                    'span.job-result-card__location', 'span.location',
+                    'div.base-search-card__metadata span.job-search-card__location'
+                ],
+                "default": "Unknown Location",
+            },
+            # LinkedIn rarely shows salary
+            "salary": {"value": "Not specified"},
+            "type": {"value": "Not specified"},
+            "summary": {"value": "Visit LinkedIn for details"},
+            "url": {
+                "selectors": [
+                    'a.base-card__full-link', 'a.job-card-container__link',
+                    'a.result-card__full-card-link', 'a.job-search-card__link'
+                ],
+                # Any link in the card, when none of the above is there
+                "fallbacks": ['a[href]'],
+                "attr": "href",
+                "default": "",
+            },
+            "posted": {
+                "selectors": [
+                    'time.job-search-card__listdate', 'time.job-result-card__listdate',
+                    'div.base-search-card__metadata time', 'span.job-search-card__listdate'
+                ],
+                "attr": "datetime",
+                "default": "Recently",
+            },
+        },
+    },
+    "simplyhired": {
+        "source": "SimplyHired",
+        "search_url": "https://www.simplyhired.com/search?q={query}{location}",
+        "location_param": "&l={location}",
+        "space": "-",
+        "page_param": "&pn={page}",
+        "page_size": 20,
+        "cards": [
             'div.SerpJob-jobCard',
             'div.job-card',
             'div.card',
             'div.jobposting-widget',
             'article.job',
             'div.job_listing'
-        ]
-
-        for selector in selectors:
-            cards = soup.select(selector)
-            if cards:
-                logger.info(f"Found {len(cards)} job cards using selector: {selector}")
-                job_cards = cards[:limit]
-                break
-
-        if not job_cards:
-            logger.warning("No job cards found on SimplyHired using any of the known selectors")
-            # Try a more generic approach
-            possible_cards = soup.find_all('div', class_=lambda c: c and ('job' in c.lower() or 'card' in c.lower()))
-            if possible_cards:
-                logger.info(f"Found {len(possible_cards)} potential job cards using generic approach")
-                job_cards = possible_cards[:limit]
-
-        for card in job_cards:
-            try:
-                # Try multiple selectors for each element
-
-                # Extract job title
-                title_selectors = [
+        ],
+        "fields": {
+            "title": {
+                "selectors": [
                     'h2.jobTitle', 'h3.jobTitle', 'h2.title', 'h3.title',
                     'a.card-link', 'h2.job-title', 'h3.job-title'
-                ]
-                title_elem = None
-                for selector in title_selectors:
-                    title_elem = card.select_one(selector)
-                    if title_elem:
-                        break
-
-                # Extract company name
-                company_selectors = [
+                ],
+                "default": "Unknown Title",
+            },
+            "company": {
+                "selectors": [
                     'span.companyName', 'div.company', 'span.company',
                     'div.companyInfo', 'div.company-name', 'span.company-name'
-                ]
-                company_elem = None
-                for selector in company_selectors:
-                    company_elem = card.select_one(selector)
-                    if company_elem:
-                        break
-
-                # Extract location
-                location_selectors = [
+                ],
+                "default": "Unknown Company",
+            },
+            "location": {
+                "selectors": [
                     'span.location', 'div.location', 'span.jobLocation',
                     'div.jobLocation', 'div.job-location', 'span.job-location'
-                ]
-                location_elem = None
-                for selector in location_selectors:
-                    location_elem = card.select_one(selector)
-                    if location_elem:
-                        break
-
-                # Extract salary
-                salary_selectors = [
+                ],
+                "default": "Unknown Location",
+            },
+            "salary": {
+                "selectors": [
                     'div.salary', 'span.salary', 'div.SerpJob-metaInfo div.salary',
                     'div.job-salary', 'span.job-salary'
-                ]
-                salary_elem = None
-                for selector in salary_selectors:
-                    salary_elem = card.select_one(selector)
-                    if salary_elem:
-                        break
-
-                # Extract summary
-                summary_selectors = [
-                    'p.jobDescription', 'div.jobDescription', 'p.description',
-                    'div.description', 'div.job-description', 'p.job-description'
-                ]
-                summary_elem = None
-                for selector in summary_selectors:
-                    summary_elem = card.select_one(selector)
-                    if summary_elem:
-                        break
-
-                # Extract values from elements
-                title = title_elem.text.strip() if title_elem else "Unknown Title"
-                company = company_elem.text.strip() if company_elem else "Unknown Company"
-                job_location = location_elem.text.strip() if location_elem else "Unknown Location"
-                salary = salary_elem.text.strip() if salary_elem else "Not specified"
-                summary = summary_elem.text.strip() if summary_elem else "No description available"
-
-                # Extract job URL
-                job_url = ""
-                # Try to find any link in the card
-                link_selectors = ['a.card-link', 'a.job-link', 'a.jobTitle', 'a.title', 'a[href*="job"]']
-                for selector in link_selectors:
-                    job_link = card.select_one(selector)
-                    if job_link and 'href' in job_link.attrs:
-                        href = job_link['href']
-                        if href.startswith('/'):
-                            job_url = f"https://www.simplyhired.com{href}"
-                        else:
-                            job_url = href
-                        break
-
-                # If no link found, try to find any link in the card
-                if not job_url:
-                    any_link = card.select_one('a[href]')
-                    if any_link and 'href' in any_link.attrs:
-                        href = any_link['href']
-                        if href.startswith('/'):
-                            job_url = f"https://www.simplyhired.com{href}"
-                        else:
-                            job_url = href
-
-                # Extract job type
-                job_type = "Not specified"
-                type_selectors = [
+                ],
+                "default": "Not specified",
+                "post": [["collapse_whitespace"]],
+            },
+            "type": {
+                "selectors": [
                     'span.jobType', 'div.jobType', 'span.job-type',
                     'div.job-type', 'span.employment-type', 'div.employment-type'
-                ]
-                for selector in type_selectors:
-                    job_type_elem = card.select_one(selector)
-                    if job_type_elem:
-                        job_type = job_type_elem.text.strip()
-                        break
-
-                # Clean up and standardize data
-                salary = re.sub(r'\s+', ' ', salary)
-
-                # Create job listing object
-                job = {
-                    "title": title,
-                    "company": company,
-                    "location": job_location,
-                    "salary": salary,
-                    "type": job_type,
-                    "summary": summary,
-                    "url": job_url,
-                    "source": "SimplyHired",
-                    "posted": "Recently"
-                }
+                ],
+                "default": "Not specified",
+            },
+            "summary": {
+                "selectors": [
+                    'p.jobDescription', 'div.jobDescription', 'p.description',
+                    'div.description', 'div.job-description', 'p.job-description'
+                ],
+                "default": "No description available",
+            },
+            "url": {
+                "selectors": ['a.card-link', 'a.job-link', 'a.jobTitle', 'a.title'],
+                # Any job link in the card, or failing that any link, when none of the above is there
+                "fallbacks": ['a[href*="job"]', 'a[href]'],
+                "attr": "href",
+                "default": "",
+                "post": [["absolute_url", "https://www.simplyhired.com"]],
+            },
+            "posted": {"value": "Recently"},
+        },
+    },
+}
+
+def collapse_whitespace(value: str) -> str:
+    """Replace runs of whitespace with a single space"""
+    return re.sub(r'\s+', ' ', value)
+
+def prefix_url(value: str, base: str) -> str:
+    """Prepend a base URL"""
+    return base + value
+
+def absolute_url(value: str, base: str) -> str:
+    """Prepend a base URL to site-relative links only"""
+    return f"{base}{value}" if value.startswith('/') else value
+
+# Post-processing steps that specs can refer to by name
+POST_PROCESSORS = {
+    "collapse_whitespace": collapse_whitespace,
+    "prefix_url": prefix_url,
+    "absolute_url": absolute_url,
+}
+
+class FieldExtractor:
+    """One job field of a site spec, with its selectors compiled"""
+
+    def __init__(self, name: str, spec: Dict[str, Any]):
+        self.name = name
+        self.value = spec.get("value")
+        self.memory = SelectorMemory(spec.get("selectors", []), spec.get("fallbacks", []))
+        self.attr = spec.get("attr")
+        self.default = spec.get("default")
+        self.post = [(POST_PROCESSORS[step[0]], step[1:]) for step in spec.get("post", [])]
+
+    def extract(self, card) -> str:
+        """Get the field's value from a job card"""
+        if self.value is not None:
+            return self.value
+
+        missed = []
+        for index in self.memory.order:
+            elem = self.memory.compiled[index].select_one(card)
+            if elem is None:
+                missed.append(index)
+                continue
+            if self.attr is None:
+                value = elem.text.strip()
+            elif self.attr in elem.attrs:
+                value = elem[self.attr]
+            else:
+                missed.append(index)
+                continue
+            self.memory.record(index, missed=missed)
+            for processor, args in self.post:
+                value = processor(value, *args)
+            return value
+        return self.default
+
+class SiteExtractor:
+    """A site spec compiled into a card finder and field extractors"""
+
+    def __init__(self, site: str, spec: Dict[str, Any]):
+        self.site = site
+        self.source = spec["source"]
+        self.search_url = spec["search_url"]
+        self.location_param = spec["location_param"]
+        self.space = spec["space"]
+        self.page_param = spec["page_param"]
+        self.page_size = spec["page_size"]
+        self.max_pages = int(os.environ.get(f"JOB_SCRAPER_MAX_PAGES_{site.upper()}", MAX_PAGES))
+        self.card_selectors = list(spec["cards"])
+        self.card_memory = SelectorMemory(self.card_selectors)
+        self.generic_fallbacks = 0
+        self.last_generic_fallback: Optional[datetime] = None
+        fields = {"source": {"value": self.source}, **spec["fields"]}
+        self.fields = [FieldExtractor(name, fields[name]) for name in JOB_FIELDS]
+
+    def build_url(self, query: str, location: Optional[str], page: int = 0) -> str:
+        """Build the search URL for a query and optional location, for the zero-based results page"""
+        url_location = "" if not location else self.location_param.format(location=location.replace(" ", self.space))
+        url = self.search_url.format(query=query.replace(" ", self.space), location=url_location)
+        if page > 0:
+            url += self.page_param.format(offset=page * self.page_size, page=page + 1)
+        return url
+
+    def card_counter(self, limit: int) -> Optional[CardCounter]:
+        """Get a counter for the card selector most likely to match, if it can be counted while streaming"""
+        index = self.card_memory.order[0]
+        rule, whole = parse_selector_compound(self.card_selectors[index])
+        if not whole:
+            return None
+        return CardCounter(index, rule, limit)
+
+    def find_cards(self, html: str, limit: int, first: Optional[int] = None) -> list:
+        """
+        Find up to `limit` job cards using the first card selector that matches any
+
+        The page is first parsed with only the card subtrees materialized. If none
+        of the selectors match, the full page is parsed for the generic fallback,
+        so results are the same as parsing the whole page up front. `first` is the
+        index of a selector to try before the remembered order, such as the one a
+        streamed download was cut short for.
+        """
+        soup = BeautifulSoup(html, HTML_PARSER_BACKEND, parse_only=get_card_strainer(tuple(self.card_selectors)))
+        order = self.card_memory.order
+        if first is not None:
+            order = [first] + [index for index in order if index != first]
+        missed = []
+        for index in order:
+            cards = self.card_memory.compiled[index].select(soup)
+            if not cards:
+                missed.append(index)
+                continue
+            # Only log when the board's markup moves to a different selector
+            changed = self.card_memory.record(index, missed=missed)
+            log = logger.info if changed else logger.debug
+            log(f"Found {len(cards)} job cards using selector: {self.card_selectors[index]}")
+            return cards[:limit]
+
+        logger.warning(f"No job cards found on {self.source} using any of the known selectors")
+        self.generic_fallbacks += 1
+        self.last_generic_fallback = datetime.now()
+
+        # Try a more generic approach
+        soup = BeautifulSoup(html, HTML_PARSER_BACKEND)
+        possible_cards = soup.find_all('div', class_=lambda c: c and ('job' in c.lower() or 'card' in c.lower()))
+        if possible_cards:
+            logger.info(f"Found {len(possible_cards)} potential job cards using generic approach")
+        return possible_cards[:limit]
+
+    def selector_counts(self) -> Dict[str, Any]:
+        """Get the raw match counters, to carry selector memory across processes"""
+        return {
+            "cards": self.card_memory.counts(),
+            "fields": {field.name: field.memory.counts() for field in self.fields},
+            "generic_fallbacks": self.generic_fallbacks,
+        }
 
+    def merge_selector_counts(self, before: Dict[str, Any], after: Dict[str, Any]) -> None:
+        """Apply the matches a parse made in a worker process to this process's selector memory"""
+        memories = [(self.card_memory, before["cards"], after["cards"])]
+        memories += [(field.memory, before["fields"][field.name], after["fields"][field.name]) for field in self.fields]
+        for memory, old_counts, new_counts in memories:
+            memory.merge_counts(old_counts, new_counts)
+
+        fallbacks = after["generic_fallbacks"] - before["generic_fallbacks"]
+        if fallbacks > 0:
+            self.generic_fallbacks += fallbacks
+            self.last_generic_fallback = datetime.now()
+
+    def selector_state(self) -> Dict[str, Any]:
+        """Get the selector memory of the cards and every extracted field"""
+        return {
+            "cards": self.card_memory.state(),
+            "generic_fallbacks": self.generic_fallbacks,
+            "last_generic_fallback": self.last_generic_fallback.isoformat() if self.last_generic_fallback else None,
+            "fields": {field.name: field.memory.state() for field in self.fields if field.value is None},
+        }
+
+    def parse(self, html: str, limit: int, first: Optional[int] = None) -> List[JobRecord]:
+        """Parse up to `limit` job listings from a results page, trying card selector `first` first if given"""
+        job_listings = []
+
+        # Log the HTML structure to help with debugging
+        logger.info(f"Parsing {self.source} HTML response...")
+
+        for card in self.find_cards(html, limit, first):
+            try:
+                job = JobRecord(*(field.extract(card) for field in self.fields))
                 job_listings.append(job)
-                logger.info(f"Successfully parsed job: {title} at {company}")
+                logger.info(f"Successfully parsed job: {job.title} at {job.company}")
             except Exception as e:
-                logger.warning(f"Error parsing SimplyHired job card: {str(e)}")
+                logger.warning(f"Error parsing {self.source} job card: {str(e)}")
                 continue
 
-        logger.info(f"Found {len(job_listings)} jobs on SimplyHired")
+        logger.info(f"Found {len(job_listings)} jobs on {self.source}")
         return job_listings
 
-    except Exception as e:
-        logger.error(f"SimplyHired scraping error: {str(e)}")
-        # Return an empty list but don't fail completely
-        return []
+# Site specs compiled once at startup
+EXTRACTORS = {site: SiteExtractor(site, spec) for site, spec in SITE_SPECS.items()}
+
+SOURCE_LIMITERS = {site: TokenBucket(SOURCE_REQUESTS_PER_MINUTE / 60, SOURCE_BURST) for site in SITE_SPECS}
+SOURCE_BREAKERS = {site: CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT) for site in SITE_SPECS}
+SOURCE_LATENCIES = {site: LatencyTracker(LATENCY_WINDOW) for site in SITE_SPECS}
+SOURCE_FETCH_STATS = {site: {"retries": 0, "hedged": 0, "hedge_wins": 0} for site in SITE_SPECS}
+
+class SourceUnavailable(Exception):
+    """Raised when a job board is skipped without being requested, because its circuit is open or of its rate limit"""
+
+def is_upstream_failure(error: Exception) -> bool:
+    """Check if an error means the job board is blocking or failing us, rather than a bug on our side"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in (403, 429) or error.status >= 500
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+def is_retryable(error: Exception) -> bool:
+    """Check if an upstream error is likely transient; blocks and rate limiting are not retried"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+async def acquire_source_slot(site: str) -> None:
+    """Wait for the job board's rate limiter to allow a request, up to SOURCE_RATE_LIMIT_WAIT seconds"""
+    limiter = SOURCE_LIMITERS[site]
+    loop = asyncio.get_running_loop()
+    give_up_at = loop.time() + SOURCE_RATE_LIMIT_WAIT
+    while not limiter.try_acquire():
+        wait = limiter.wait_time()
+        if loop.time() + wait > give_up_at:
+            raise SourceUnavailable(f"rate limit of {SOURCE_REQUESTS_PER_MINUTE:g} requests per minute reached")
+        await asyncio.sleep(wait)
+
+def parse_site_page(
+    site: str,
+    first: Optional[int],
+    body: bytes,
+    encoding: str,
+    limit: int
+) -> Tuple[List[JobRecord], Dict[str, Any], Dict[str, Any]]:
+    """
+    Parse a raw results page into job records, in whichever process runs it
 
-@app.get("/api/jobs/search")
-async def search_jobs(
-    query: str,
-    location: Optional[str] = None,
-    source: Optional[str] = "all",
-    limit: int = 10
-):
+    Also returns the selector counters from before and after the parse, so a
+    parent process can learn which selectors a worker process found matching.
     """
-    Search for jobs based on query and location
+    extractor = EXTRACTORS[site]
+    before = extractor.selector_counts()
+    jobs = extractor.parse(body.decode(encoding, errors="replace"), limit, first)
+    return jobs, before, extractor.selector_counts()
+
+async def parse_off_loop(
+    site: str,
+    first: Optional[int],
+    body: bytes,
+    encoding: str,
+    limit: int
+) -> List[JobRecord]:
+    """Parse a results page on the parse pool so the event loop keeps serving requests"""
+    executor = get_parse_executor()
+    if executor is None:
+        return parse_site_page(site, first, body, encoding, limit)[0]
+
+    loop = asyncio.get_running_loop()
+    try:
+        jobs, before, after = await loop.run_in_executor(executor, parse_site_page, site, first, body, encoding, limit)
+    except BrokenProcessPool:
+        # A worker died, so start a fresh pool for the next page
+        logger.error("Parse pool broke, restarting it")
+        close_parse_executor()
+        raise
 
-    Parameters:
-    - query: Job title, skills, or keywords
-    - location: Location for job search (city, state, country)
-    - source: Job site to scrape (indeed, linkedin, simplyhired, all)
-    - limit: Maximum number of results to return
+    if isinstance(executor, ProcessPoolExecutor):
+        EXTRACTORS[site].merge_selector_counts(before, after)
+    return jobs
+
+async def fetch_hedged(
+    site: str,
+    counter: Optional[CardCounter],
+    url: str,
+    conditions: Optional[Dict[str, str]] = None
+) -> FetchedPage:
     """
+    Fetch a page from a job board, hedging with a second fetch when the first is slow
+
+    With hedging enabled and enough latency samples, a second identical fetch
+    is sent if the first has not finished by the board's p95 latency, and
+    only if the board's rate limiter has a slot free right away. Whichever
+    succeeds first wins and the other is cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    def attempt() -> asyncio.Task:
+        return asyncio.create_task(fetch_page(url, counter.fresh() if counter is not None else None, conditions))
+
+    hedge_after = SOURCE_LATENCIES[site].percentile(HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES) if HEDGE_REQUESTS else None
+    primary = attempt()
+    tasks = {primary}
     try:
-        jobs = []
-        source_used = source.lower() if source else "all"
-
-        if source_used == "indeed" or source_used == "all":
-            indeed_jobs = await scrape_indeed(query, location, limit)
-            jobs.extend(indeed_jobs)
-            logger.info(f"Added {len(indeed_jobs)} jobs from Indeed")
-
-        if source_used == "linkedin" or source_used == "all":
-            linkedin_jobs = await scrape_linkedin(query, location, limit)
-            jobs.extend(linkedin_jobs)
-            logger.info(f"Added {len(linkedin_jobs)} jobs from LinkedIn")
-
-        if source_used == "simplyhired" or source_used == "all":
-            simplyhired_jobs = await scrape_simplyhired(query, location, limit)
-            jobs.extend(simplyhired_jobs)
-            logger.info(f"Added {len(simplyhired_jobs)} jobs from SimplyHired")
-
-        # If no jobs found from any source, try to get jobs from any source
-        if not jobs and source_used != "all":
-            logger.warning(f"No jobs found from {source_used}, trying other sources")
-            indeed_jobs = await scrape_indeed(query, location, limit)
-            linkedin_jobs = await scrape_linkedin(query, location, limit)
-            simplyhired_jobs = await scrape_simplyhired(query, location, limit)
-
-            jobs.extend(indeed_jobs)
-            jobs.extend(linkedin_jobs)
-            jobs.extend(simplyhired_jobs)
-
-            logger.info(f"Added {len(indeed_jobs)} jobs from Indeed (fallback)")
-            logger.info(f"Added {len(linkedin_jobs)} jobs from LinkedIn (fallback)")
-            logger.info(f"Added {len(simplyhired_jobs)} jobs from SimplyHired (fallback)")
-
-        # Deduplicate jobs based on title and company
-        seen = set()
-        unique_jobs = []
-
-        for job in jobs:
-            key = f"{job['title']}-{job['company']}"
-            if key not in seen:
-                seen.add(key)
-                unique_jobs.append(job)
-
-        # Limit to requested number
-        unique_jobs = unique_jobs[:limit]
+        if hedge_after is not None:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done and SOURCE_LIMITERS[site].try_acquire():
+                logger.info(f"Hedging fetch of {url} after {hedge_after:.2f}s")
+                SOURCE_FETCH_STATS[site]["hedged"] += 1
+                tasks.add(attempt())
+
+        error: Optional[BaseException] = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not primary:
+                        SOURCE_FETCH_STATS[site]["hedge_wins"] += 1
+                    SOURCE_LATENCIES[site].record(loop.time() - started)
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def fetch_with_retries(
+    site: str,
+    counter: Optional[CardCounter],
+    deadline: Optional[float],
+    url: str,
+    conditions: Optional[Dict[str, str]] = None
+) -> FetchedPage:
+    """Fetch a page from a job board, retrying transient errors with jittered exponential backoff until the deadline"""
+    loop = asyncio.get_running_loop()
+    attempt = 0
+    while True:
+        try:
+            return await fetch_hedged(site, counter, url, conditions)
+        except Exception as e:
+            if attempt >= RETRY_ATTEMPTS or not is_retryable(e):
+                raise
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+            if deadline is not None and loop.time() + delay >= deadline:
+                raise
+            attempt += 1
+            SOURCE_FETCH_STATS[site]["retries"] += 1
+            logger.warning(f"Retrying {url} in {delay:.2f}s (attempt {attempt} of {RETRY_ATTEMPTS}) after: {str(e)}")
+            await asyncio.sleep(delay)
+            await acquire_source_slot(site)
+
+async def fetch_upstream(
+    site: str,
+    counter: Optional[CardCounter],
+    deadline: Optional[float],
+    url: str,
+    conditions: Optional[Dict[str, str]] = None
+) -> FetchedPage:
+    """
+    Fetch a page from a job board and report the outcome to its circuit breaker
 
-        return {
-            "query": query,
-            "location": location,
-            "source": source_used,
-            "results_count": len(unique_jobs),
-            "jobs": unique_jobs
-        }
+    This only runs in the call that owns a scrape flight, so every upstream
+    request is counted once, however many callers share it. A page that only
+    arrives after the source deadline counts as a failure, as callers have
+    given up on it by then.
+    """
+    breaker = SOURCE_BREAKERS[site]
+    loop = asyncio.get_running_loop()
+    try:
+        page = await fetch_with_retries(site, counter, deadline, url, conditions)
     except Exception as e:
-        logger.error(f"Error in search_jobs: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to search jobs: {str(e)}")
+        if is_upstream_failure(e):
+            breaker.record_failure(f"{type(e).__name__}: {str(e)}")
+        raise
+    if deadline is not None and loop.time() > deadline + PAGE_DEADLINE_MARGIN:
+        breaker.record_failure(f"responded after the {SOURCE_TIMEOUT}s source deadline")
+    else:
+        breaker.record_success()
+    return page
+
+async def fetch_site_page(site: str, url: str, limit: int, deadline: Optional[float] = None) -> List[JobRecord]:
+    """Fetch and parse up to `limit` jobs from one results page of a job board, within its rate limit"""
+    # Only new fetches count against the rate limit, not callers joining one already running
+    if not SCRAPE_FLIGHTS.in_flight(normalize_url(url)):
+        await acquire_source_slot(site)
+
+    # Stop downloading once the first `limit` cards have arrived, when the likeliest selector allows counting them
+    counter = EXTRACTORS[site].card_counter(limit) if STREAM_EARLY_STOP else None
+    first = counter.index if counter is not None else None
+    fetch = partial(fetch_upstream, site, counter, deadline)
+    return await fetch_jobs(url, limit, partial(parse_off_loop, site, first), fetch)
+
+async def scrape_pages(
+    site: str,
+    query: str,
+    location: Optional[str],
+    limit: int,
+    deadline: Optional[float]
+) -> List[JobRecord]:
+    """
+    Scrape results pages of a job board concurrently until `limit` unique jobs are found
 
-async def scrape_indeed(query: str, location: Optional[str], limit: int) -> List[Dict[str, Any]]:
-    """Scrape Indeed for job listings"""
-    logger.info(f"Scraping Indeed for '{query}' in '{location}'")
+    Pages are fetched in batches sized by how many jobs are still missing, up
+    to the board's page cap. Outstanding pages are cancelled once enough
+    unique jobs (by title and company) are in. At the deadline (an event
+    loop time) whatever was collected is returned. A page without jobs marks
+    the end of the results.
+    """
+    extractor = EXTRACTORS[site]
+    loop = asyncio.get_running_loop()
+    page_limit = min(limit, extractor.page_size)
+    pages: Dict[int, List[JobRecord]] = {}
+    seen = set()
+    first_error: Optional[BaseException] = None
+
+    next_page = 0
+    while next_page < extractor.max_pages:
+        missing = limit - len(seen)
+        batch = range(next_page, min(extractor.max_pages, next_page + max(1, math.ceil(missing / page_limit))))
+        next_page = batch.stop
+        tasks = {
+            asyncio.create_task(fetch_site_page(site, extractor.build_url(query, location, page), page_limit, deadline)): page
+            for page in batch
+        }
+        logger.info(f"Fetching {extractor.source} results pages {batch.start + 1}-{batch.stop}")
 
-    # Format query for URL
-    formatted_query = query.replace(" ", "+")
-    url_location = "" if not location else f"&l={location.replace(' ', '+')}"
+        pending = set(tasks)
+        while pending and len(seen) < limit:
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    logger.error(f"{extractor.source} page {tasks[task] + 1} scraping error: {str(task.exception())}")
+                    pages[tasks[task]] = []
+                    first_error = first_error or task.exception()
+                    continue
+                pages[tasks[task]] = task.result()
+                seen.update(f"{job.title}-{job.company}" for job in task.result())
+
+        for task in pending:
+            task.cancel()
+        if pending and len(seen) < limit:
+            logger.warning(f"Deadline reached while paging {extractor.source}, returning {len(seen)} jobs")
+            break
+        if len(seen) >= limit or any(not pages[page] for page in batch):
+            break
+
+    # A board that failed without returning any page is failing as a whole
+    if first_error is not None and not any(pages.values()):
+        raise first_error
+
+    # Merge pages in order, dropping jobs repeated across pages
+    jobs = []
+    for page in sorted(pages):
+        jobs.extend(pages[page])
+    return dedupe_jobs(jobs)[:limit]
+
+async def scrape_site(
+    site: str,
+    query: str,
+    location: Optional[str],
+    limit: int,
+    deadline: Optional[float] = None
+) -> List[JobRecord]:
+    """
+    Scrape a job board for job listings, paging through results when the board allows more than one page
 
-    url = f"https://www.indeed.com/jobs?q={formatted_query}{url_location}&sort=date"
-    logger.info(f"Scraping URL: {url}")
+    Raises SourceUnavailable when the board is skipped because its circuit is
+    open or its rate limit is reached, so callers can report it.
+    """
+    extractor = EXTRACTORS[site]
+    breaker = SOURCE_BREAKERS[site]
+    if not breaker.allow():
+        logger.warning(f"Skipping {extractor.source}: circuit open after repeated failures ({breaker.last_failure})")
+        raise SourceUnavailable(f"circuit open after repeated failures ({breaker.last_failure})")
+    logger.info(f"Scraping {extractor.source} for '{query}' in '{location}'")
 
     try:
-        # Make the request with random headers
-        response = requests.get(url, headers=get_random_headers(), timeout=15)
-        response.raise_for_status()
+        if extractor.max_pages > 1:
+            jobs = await scrape_pages(site, query, location, limit, deadline)
+        else:
+            url = extractor.build_url(query, location)
+            logger.info(f"Scraping URL: {url}")
+            jobs = await fetch_site_page(site, url, limit, deadline)
+        return jobs
+
+    except SourceUnavailable as e:
+        logger.warning(f"Skipping {extractor.source}: {str(e)}")
+        raise
 
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-        job_listings = []
+    except Exception as e:
+        logger.error(f"{extractor.source} scraping error: {str(e)}")
+        # Return an empty list but don't fail completely
+        return []
 
-        # Log the HTML structure to help with debugging
-        logger.info("Parsing Indeed HTML response...")
+# Job boards available to search_jobs, in the order their results are merged
+SCRAPERS = {site: partial(scrape_site, site) for site in SITE_SPECS}
 
-        # Try multiple selectors for job cards as Indeed frequently changes their HTML structure
-        job_cards = []
-        selectors = [
-            'div.job_seen_beacon',
-            'div.cardOutline',
-            'div.css-1m4cuuf',
-            'div.jobsearch-ResultsList > div',
-            'div[data-testid="job-card"]',
-            'div.tapItem'
-        ]
+async def iter_sources(
+    sources: List[str],
+    query: str,
+    location: Optional[str],
+    limit: int,
+    deadline: float,
+    force_refresh: bool = False,
+    age: Optional[ResultAge] = None,
+    skipped: Optional[List[str]] = None
+) -> AsyncIterator[Tuple[str, Optional[List[JobRecord]]]]:
+    """
+    Scrape several job boards concurrently, yielding (source, jobs) as each one finishes
+
+    Sources with results in SOURCE_CACHE are yielded first without scraping,
+    their age noted in `age`, unless force_refresh is set.
+    Each remaining source gets its own timeout and the whole fan-out stops at
+    the deadline (an event loop time). Sources that timed out are yielded with
+    None for jobs, and failed sources with no jobs. Sources skipped because
+    their circuit is open or their rate limit is reached are also yielded with
+    no jobs, and added to `skipped`. Scrapes still running when the caller
+    stops iterating are cancelled.
+    """
+    to_scrape = []
+    for name in sources:
+        cached = await get_cached_source_jobs(name, query, location, limit) if not force_refresh else None
+        if cached is None:
+            to_scrape.append(name)
+            continue
+        cached_jobs, cached_age = cached
+        if age is not None:
+            age.observe(cached_age)
+        logger.info(f"Added {len(cached_jobs)} cached jobs from {name}")
+        yield name, cached_jobs
+
+    loop = asyncio.get_running_loop()
+    remaining = deadline - loop.time()
+    if to_scrape and remaining <= 0:
+        logger.warning(f"Search budget exhausted before scraping: {to_scrape}")
+        for name in to_scrape:
+            yield name, None
+        return
+    if not to_scrape:
+        return
 
-        for selector in selectors:
-            cards = soup.select(selector)
-            if cards:
-                logger.info(f"Found {len(cards)} job cards using selector: {selector}")
-                job_cards = cards[:limit]
+    timeout = min(SOURCE_TIMEOUT, remaining)
+    # Paginated scrapes stop just short of their timeout so they can return the pages they have
+    source_deadline = loop.time() + timeout - PAGE_DEADLINE_MARGIN
+    tasks = {
+        asyncio.create_task(
+            asyncio.wait_for(SCRAPERS[name](query, location, limit, deadline=source_deadline), timeout=timeout)
+        ): name
+        for name in to_scrape
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=deadline - loop.time(), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
                 break
+            for task in sorted(done, key=lambda task: to_scrape.index(tasks[task])):
+                name = tasks[task]
+                if task.cancelled() or isinstance(task.exception(), asyncio.TimeoutError):
+                    logger.warning(f"Scraping {name} exceeded its {SOURCE_TIMEOUT}s deadline")
+                    yield name, None
+                elif isinstance(task.exception(), SourceUnavailable):
+                    if skipped is not None:
+                        skipped.append(name)
+                    yield name, []
+                elif task.exception() is not None:
+                    logger.error(f"Scraping {name} failed: {str(task.exception())}")
+                    yield name, []
+                else:
+                    source_jobs = task.result()
+                    logger.info(f"Added {len(source_jobs)} jobs from {name}")
+
+                    # Empty results are not cached, since scrapers also return nothing on errors
+                    if source_jobs:
+                        set_cached_source_jobs(name, query, location, limit, source_jobs)
+                        schedule_index_jobs(query, source_jobs)
+                    yield name, source_jobs
+
+        for task in sorted(pending, key=lambda task: to_scrape.index(tasks[task])):
+            logger.warning(f"Search budget ran out while scraping {tasks[task]}")
+            yield tasks[task], None
+    finally:
+        for task in pending:
+            task.cancel()
 
-        if not job_cards:
-            logger.warning("No job cards found on Indeed using any of the known selectors")
-            # Try a more generic approach
-            possible_cards = soup.find_all('div', class_=lambda c: c and ('job' in c.lower() or 'card' in c.lower()))
-            if possible_cards:
-                logger.info(f"Found {len(possible_cards)} potential job cards using generic approach")
-                job_cards = possible_cards[:limit]
+async def scrape_sources(
+    sources: List[str],
+    query: str,
+    location: Optional[str],
+    limit: int,
+    deadline: float,
+    force_refresh: bool = False,
+    age: Optional[ResultAge] = None
+) -> Tuple[List[JobRecord], List[str], List[str]]:
+    """
+    Scrape several job boards concurrently
 
-        for card in job_cards:
-            try:
-                # Try multiple selectors for each element as Indeed frequently changes their HTML structure
-
-                # Extract job title
-                title_selectors = [
-                    'h2.jobTitle span', 'h2.jobTitle', 'h2 span', 'h2 a',
-                    'a.jcs-JobTitle', 'h2[data-testid="jobTitle"]',
-                    'span[title]', 'a[data-jk]', 'a.jobtitle'
-                ]
-                title_elem = None
-                for selector in title_selectors:
-                    title_elem = card.select_one(selector)
-                    if title_elem:
-                        break
-
-                # Extract company name
-                company_selectors = [
-                    'span.companyName', 'div.company_location a', 'span.company',
-                    'div.companyInfo a', 'span[data-testid="company-name"]',
-                    'div.company', 'span.company-name'
-                ]
-                company_elem = None
-                for selector in company_selectors:
-                    company_elem = card.select_one(selector)
-                    if company_elem:
-                        break
-
-                # Extract location
-                location_selectors = [
-                    'div.companyLocation', 'span.location', 'div.location',
-                    'span[data-testid="location"]', 'div.recJobLoc'
-                ]
-                location_elem = None
-                for selector in location_selectors:
-                    location_elem = card.select_one(selector)
-                    if location_elem:
-                        break
-
-                # Extract salary
-                salary_selectors = [
-                    'div.salary-snippet', 'div.metadata.salary-snippet-container',
-                    'span.salaryText', 'div[data-testid="salary-snippet"]',
-                    'span.salary'
-                ]
-                salary_elem = None
-                for selector in salary_selectors:
-                    salary_elem = card.select_one(selector)
-                    if salary_elem:
-                        break
-
-                # Extract summary
-                summary_selectors = [
-                    'div.job-snippet', 'div.summary', 'div[data-testid="job-snippet"]',
-                    'div.snippet', 'span.summary'
-                ]
-                summary_elem = None
-                for selector in summary_selectors:
-                    summary_elem = card.select_one(selector)
-                    if summary_elem:
-                        break
-
-                # Extract values from elements
-                title = title_elem.text.strip() if title_elem else "Unknown Title"
-                company = company_elem.text.strip() if company_elem else "Unknown Company"
-                job_location = location_elem.text.strip() if location_elem else "Unknown Location"
-                salary = salary_elem.text.strip() if salary_elem else "Not specified"
-                summary = summary_elem.text.strip() if summary_elem else "No description available"
-
-                # Extract job URL
-                job_url = ""
-                # Try multiple selectors for job links
-                link_selectors = ['h2.jobTitle a', 'a.jcs-JobTitle', 'a[data-jk]', 'a.jobtitle', 'a[href*="clk"]']
-                for selector in link_selectors:
-                    job_link = card.select_one(selector)
-                    if job_link and 'href' in job_link.attrs:
-                        job_url = "https://www.indeed.com" + job_link['href']
-                        break
-
-                # Extract job type
-                job_type = "Not specified"
-                type_selectors = [
-                    'div.metadata span.attribute_snippet', 'span.jobType',
-                    'div[data-testid="attribute_snippet"]', 'div.job-types'
-                ]
-                for selector in type_selectors:
-                    job_type_elem = card.select_one(selector)
-                    if job_type_elem:
-                        job_type = job_type_elem.text.strip()
-                        break
-
-                # Clean up and standardize data
-                salary = re.sub(r'\s+', ' ', salary)
-
-                # Create job listing object
-                job = {
-                    "title": title,
-                    "company": company,
-                    "location": job_location,
-                    "salary": salary,
-                    "type": job_type,
-                    "summary": summary,
-                    "url": job_url,
-                    "source": "Indeed",
-                    "posted": "Recently"  # Indeed doesn't always show exact dates
-                }
+    Jobs from sources that finished in time are returned in source order,
+    together with the names of the sources that timed out and of those that
+    were skipped because their circuit is open or their rate limit is reached.
+    """
+    results = {}
+    skipped = []
+    async for name, source_jobs in iter_sources(sources, query, location, limit, deadline, force_refresh, age, skipped):
+        results[name] = source_jobs
+
+    jobs = []
+    timed_out = []
+    for name in sources:
+        if results.get(name) is None:
+            timed_out.append(name)
+        else:
+            jobs.extend(results[name])
+    return jobs, timed_out, [name for name in sources if name in skipped]
+
+# Near-duplicate detection across job boards. Jobs are compared by the Jaccard
+# similarity of their normalized title and company tokens, estimated with
+# MinHash signatures and bucketed with LSH banding so only likely pairs are compared.
+DEDUPE_THRESHOLD = float(os.environ.get("JOB_SCRAPER_DEDUPE_THRESHOLD", "0.8"))  # Minimum similarity to merge two jobs
+MINHASH_PERMUTATIONS = 128
+MINHASH_BANDS = 16  # 8 rows per band, so pairs from about 0.7 similarity up end up in a shared bucket
+MINHASH_PRIME = (1 << 61) - 1
+
+def make_minhash_params(count: int, seed: int) -> List[Tuple[int, int]]:
+    """Draw the (a, b) coefficients of the hash permutations, fixed so signatures are stable"""
+    rng = random.Random(seed)
+    return [(rng.randrange(1, MINHASH_PRIME), rng.randrange(0, MINHASH_PRIME)) for _ in range(count)]
+
+MINHASH_PARAMS = make_minhash_params(MINHASH_PERMUTATIONS, seed=1)
+
+# Title abbreviations expanded before comparing, and company suffixes ignored
+TITLE_ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "assoc": "associate",
+    "dev": "developer", "eng": "engineer", "engr": "engineer", "mgr": "manager",
+    "sw": "software", "swe": "software engineer", "sde": "software developer",
+    "ii": "2", "iii": "3", "iv": "4",
+}
+COMPANY_SUFFIXES = {"inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company", "gmbh", "plc", "the"}
+# Letters and digits of any script, plus "+" and "#" for names such as C++ and C#
+DEDUPE_TOKEN_PATTERN = re.compile(r"(?:[^\W_]|[+#])+")
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and strip accents so spelling variants compare equal"""
+    if not text or text.isascii():
+        return (text or "").lower()
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in text if not unicodedata.combining(char)).lower()
+
+def job_tokens(job: JobRecord) -> frozenset:
+    """
+    Get the normalized title and company tokens of a job, company tokens marked with @
 
-                job_listings.append(job)
-                logger.info(f"Successfully parsed job: {title} at {company}")
-            except Exception as e:
-                logger.warning(f"Error parsing Indeed job card: {str(e)}")
-                continue
+    A job with no tokens, such as one whose title and company are only
+    punctuation, gets its exact normalized title and company as a single
+    token marked with =, so it only matches the same text.
+    """
+    title_text = normalize_text(job.title or "")
+    company_text = normalize_text(job.company or "")
+    title = []
+    for token in DEDUPE_TOKEN_PATTERN.findall(title_text):
+        title.extend(TITLE_ABBREVIATIONS.get(token, token).split())
+    company = ["@" + token for token in DEDUPE_TOKEN_PATTERN.findall(company_text) if token not in COMPANY_SUFFIXES]
+    if not title and not company:
+        return frozenset(["=" + title_text.strip() + "|" + company_text.strip()])
+    return frozenset(title + company)
+
+@lru_cache(maxsize=65536)
+def token_permutations(token: str) -> Tuple[int, ...]:
+    """Hash a token under every permutation once, since job titles share a small vocabulary"""
+    value = zlib.crc32(token.encode("utf-8"))
+    return tuple((a * value + b) % MINHASH_PRIME for a, b in MINHASH_PARAMS)
+
+def minhash_signature(tokens: frozenset) -> Tuple[int, ...]:
+    """Compute the MinHash signature of a token set"""
+    return tuple(map(min, zip(*(token_permutations(token) for token in tokens))))
+
+def jaccard(first: frozenset, second: frozenset) -> float:
+    """Get the Jaccard similarity of two token sets"""
+    return len(first & second) / len(first | second) if first or second else 1.0
+
+# Values the site specs fill in when a field is missing or not shown by a board, which make a record poorer
+PLACEHOLDER_VALUES = {
+    field[key]
+    for spec in SITE_SPECS.values()
+    for field in spec["fields"].values()
+    for key in ("default", "value")
+    if key in field
+}
+
+def has_value(value: Optional[str]) -> bool:
+    """Check if a job field holds real data rather than nothing or a placeholder"""
+    return bool(value) and value not in PLACEHOLDER_VALUES
+
+def job_richness(job: JobRecord) -> Tuple[int, int, int]:
+    """
+    Rank a job record by whether it has a salary and a summary, then by how
+    many fields it actually has, then by the length of its summary
+    """
+    filled = sum(1 for name in JOB_FIELDS if has_value(getattr(job, name)))
+    return has_value(job.salary) + has_value(job.summary), filled, len(job.summary) if has_value(job.summary) else 0
 
-        logger.info(f"Found {len(job_listings)} jobs on Indeed")
-        return job_listings
+def cluster_jobs(jobs: List[JobRecord]) -> List[List[int]]:
+    """
+    Group the indexes of duplicate and near-duplicate job listings
 
-    except Exception as e:
-        logger.error(f"Indeed scraping error: {str(e)}")
-        # Return an empty list but don't fail completely
-        return []
+    "Sr. Python Developer – Acme Inc" and "Senior Python Developer - ACME" are
+    the same job. Jobs whose tokens are at least DEDUPE_THRESHOLD similar end
+    up in one cluster. Clusters are sorted, and ordered by their first job.
+    """
+    # Identical token sets are grouped directly, so only distinct ones are hashed
+    groups: Dict[frozenset, List[int]] = {}
+    for index, job in enumerate(jobs):
+        groups.setdefault(job_tokens(job), []).append(index)
+    token_sets = list(groups)
+
+    parent = list(range(len(token_sets)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for node, tokens in enumerate(token_sets):
+        if not tokens:
+            continue
+        signature = minhash_signature(tokens)
+        candidates = set()
+        for band in range(MINHASH_BANDS):
+            bucket = buckets.setdefault((band, signature[band * rows:(band + 1) * rows]), [])
+            candidates.update(bucket)
+            bucket.append(node)
+
+        # Confirm candidates with their exact similarity, since a shared bucket is only likely similar
+        for other in candidates:
+            if find(other) != find(node) and jaccard(token_sets[other], tokens) >= DEDUPE_THRESHOLD:
+                parent[find(node)] = find(other)
+
+    clusters: Dict[int, List[int]] = {}
+    for node, tokens in enumerate(token_sets):
+        clusters.setdefault(find(node), []).extend(groups[tokens])
+    return sorted((sorted(members) for members in clusters.values()), key=lambda members: members[0])
+
+def richest_job(jobs: List[JobRecord], members: List[int]) -> JobRecord:
+    """Pick the record with the most details among a cluster, the earliest on ties"""
+    return jobs[max(members, key=lambda index: (job_richness(jobs[index]), -index))]
+
+def dedupe_jobs(jobs: List[JobRecord]) -> List[JobRecord]:
+    """
+    Merge duplicate and near-duplicate job listings
 
-async def scrape_linkedin(query: str, location: Optional[str], limit: int) -> List[Dict[str, Any]]:
-    """Scrape LinkedIn for job listings"""
-    logger.info(f"Scraping LinkedIn for '{query}' in '{location}'")
+    Each cluster from cluster_jobs() is replaced by its richest record, such as
+    the one with a salary or summary, at the position of the cluster's first job.
+    """
+    return [richest_job(jobs, members) for members in cluster_jobs(jobs)]
 
-    # Format query for URL
-    formatted_query = query.replace(" ", "%20")
-    url_location = "" if not location else f"&location={location.replace(' ', '%20')}"
+class StreamDeduper:
+    """
+    Deduplicates jobs that arrive in batches, for responses streamed as they are found
 
-    url = f"https://www.linkedin.com/jobs/search/?keywords={formatted_query}{url_location}&sortBy=DD"
-    logger.info(f"Scraping URL: {url}")
+    Jobs already sent cannot be taken back, so a new job is only passed on
+    when it is not a duplicate of one sent before. Duplicates within a batch
+    are merged into their richest record as in dedupe_jobs().
+    """
 
+    def __init__(self):
+        self.sent: List[JobRecord] = []
+
+    def add(self, jobs: List[JobRecord], limit: Optional[int] = None) -> List[JobRecord]:
+        """Get up to `limit` jobs of a batch that are new, and remember them as sent"""
+        candidates = self.sent + jobs
+        new_jobs = [
+            richest_job(candidates, members)
+            for members in cluster_jobs(candidates)
+            if members[0] >= len(self.sent)
+        ][:limit]
+        self.sent.extend(new_jobs)
+        return new_jobs
+
+# BM25 relevance ranking of jobs against a skill list. Titles count more than
+# summaries, and skills match whole tokens so "java" does not match "javascript".
+BM25_K1 = 1.2
+BM25_B = 0.75
+BM25_TITLE_WEIGHT = 2  # A title mention counts as this many summary mentions
+RANKING_TOKEN_PATTERN = re.compile(r"[a-z0-9](?:[a-z0-9+#]|\.(?=[a-z0-9]))*[+#]*")
+
+def ranking_tokens(text: str) -> List[str]:
+    """Split text into lowercase tokens, keeping skills like c++, c#, node.js and .net whole"""
+    return RANKING_TOKEN_PATTERN.findall(normalize_text(text))
+
+def term_counts(tokens: List[str], starts: Dict[str, List[Tuple[str, ...]]]) -> Dict[Tuple[str, ...], int]:
+    """Count occurrences of the skill terms, indexed by first token, so multi-word skills match as phrases"""
+    counts: Dict[Tuple[str, ...], int] = {}
+    for position, token in enumerate(tokens):
+        for term in starts.get(token, ()):
+            if len(term) == 1 or tuple(tokens[position:position + len(term)]) == term:
+                counts[term] = counts.get(term, 0) + 1
+    return counts
+
+def rank_jobs(jobs: List[JobRecord], skills: List[str]) -> List[JobRecord]:
+    """
+    Order jobs by BM25 relevance to a skill list, most relevant first
+
+    Every job is tokenized once into sparse term counts, from which document
+    frequencies for the skills are gathered. All jobs are then scored in one
+    pass over each skill's postings. Jobs with equal scores keep their order.
+    """
+    terms = {tuple(ranking_tokens(skill)) for skill in skills}
+    terms.discard(())
+    if not jobs or not terms:
+        return list(jobs)
+    starts: Dict[str, List[Tuple[str, ...]]] = {}
+    for term in terms:
+        starts.setdefault(term[0], []).append(term)
+
+    # Postings: for each skill term, the weighted term frequency in each job that has it
+    postings: Dict[Tuple[str, ...], Dict[int, int]] = {term: {} for term in terms}
+    doc_lengths = []
+    for index, job in enumerate(jobs):
+        title = ranking_tokens(job.title or "")
+        summary = ranking_tokens(job.summary or "")
+        doc_lengths.append(BM25_TITLE_WEIGHT * len(title) + len(summary))
+        title_counts = term_counts(title, starts)
+        summary_counts = term_counts(summary, starts)
+        for term in terms:
+            frequency = BM25_TITLE_WEIGHT * title_counts.get(term, 0) + summary_counts.get(term, 0)
+            if frequency:
+                postings[term][index] = frequency
+
+    count = len(jobs)
+    average_length = sum(doc_lengths) / count or 1.0
+    scores = [0.0] * count
+    for term, frequencies in postings.items():
+        idf = math.log(1 + (count - len(frequencies) + 0.5) / (len(frequencies) + 0.5))
+        for index, frequency in frequencies.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[index] / average_length)
+            scores[index] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+
+    order = sorted(range(count), key=lambda index: -scores[index])
+    return [jobs[index] for index in order]
+
+# Local index of every scraped job listing, searched before scraping when configured
+JOB_INDEX_PATH = os.environ.get("JOB_SCRAPER_JOB_INDEX", "")  # SQLite file; empty disables the index
+JOB_INDEX_MAX_AGE = float(os.environ.get("JOB_SCRAPER_JOB_INDEX_MAX_AGE", str(6 * 3600)))  # Seconds a listing counts as fresh
+JOB_INDEX_RETENTION = float(os.environ.get("JOB_SCRAPER_JOB_INDEX_RETENTION", str(7 * 86400)))  # Seconds before unseen listings are dropped
+
+def job_identity(job: JobRecord) -> str:
+    """Get a key that is the same for a job listed with minor spelling differences on any board"""
+    location = " ".join(DEDUPE_TOKEN_PATTERN.findall(normalize_text(job.location or "")))
+    canonical = " ".join(sorted(job_tokens(job))) + "|" + location
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+def fts_phrase(text: str) -> str:
+    """Quote text as an FTS5 phrase, so user input is never read as query syntax"""
+    return '"' + text.replace('"', '""') + '"'
+
+class JobIndex:
+    """
+    SQLite store of scraped job listings with an FTS5 full-text index
+
+    Listings are keyed by job_identity(), so a job scraped again from any board
+    updates its row and last-seen time, keeping the richer of the two records.
+    The full-text index covers titles, companies and summaries, plus the search
+    queries a listing was returned for, since boards also match on words the
+    listing itself does not contain.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id INTEGER PRIMARY KEY, identity TEXT NOT NULL UNIQUE, source TEXT NOT NULL, location TEXT NOT NULL, "
+            "queries TEXT NOT NULL, first_seen REAL NOT NULL, last_seen REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen)")
+        self._conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(title, company, summary, queries)")
+
+    def upsert(self, jobs: List[JobRecord], query: str) -> None:
+        """Insert or refresh listings scraped for a search query"""
+        now = time.time()
+        canonical_query = " ".join(query.split()).lower()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for job in jobs:
+                    self._upsert(job, canonical_query, now)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _upsert(self, job: JobRecord, query: str, now: float) -> None:
+        row = self._conn.execute("SELECT id, queries, data FROM jobs WHERE identity = ?", (job_identity(job),)).fetchone()
+        if row is None:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (identity, source, location, queries, first_seen, last_seen, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_identity(job), job.source or "", job.location or "", query, now, now, json.dumps(job.to_dict()))
+            )
+            job_id = cursor.lastrowid
+            queries = query
+        else:
+            job_id, queries, data = row
+            if query not in queries.split("|"):
+                queries = f"{queries}|{query}"
+            stored = JobRecord.from_dict(json.loads(data))
+            if job_richness(job) >= job_richness(stored):
+                stored = job
+            self._conn.execute(
+                "UPDATE jobs SET source = ?, location = ?, queries = ?, last_seen = ?, data = ? WHERE id = ?",
+                (stored.source or "", stored.location or "", queries, now, json.dumps(stored.to_dict()), job_id)
+            )
+            job = stored
+            self._conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", (job_id,))
+        self._conn.execute(
+            "INSERT INTO jobs_fts (rowid, title, company, summary, queries) VALUES (?, ?, ?, ?, ?)",
+            (job_id, job.title or "", job.company or "", job.summary or "", queries.replace("|", " | "))
+        )
+
+    def search(self, query: str, location: Optional[str], sources: List[str], limit: int) -> List[Tuple[JobRecord, float]]:
+        """
+        Find up to `limit` fresh listings matching all query words, or returned
+        for the query, best first, each with the time it was last scraped
+        """
+        words = ranking_tokens(query)
+        if not words:
+            return []
+        match = f'({" ".join(fts_phrase(word) for word in words)}) OR queries : {fts_phrase(" ".join(words))}'
+        sql = (
+            "SELECT jobs.data, jobs.last_seen FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid "
+            "WHERE jobs_fts MATCH ? AND jobs.last_seen >= ?"
+        )
+        params: List[Any] = [match, time.time() - JOB_INDEX_MAX_AGE]
+        if sources:
+            sql += f" AND jobs.source IN ({', '.join('?' for _ in sources)})"
+            params.extend(sources)
+        if location:
+            sql += " AND jobs.location LIKE ? ESCAPE '\\'"
+            escaped = " ".join(location.split()).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        # Title matches weigh most, then company, summary and the queries a listing came from
+        sql += " ORDER BY bm25(jobs_fts, 4.0, 2.0, 1.0, 1.0) LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(JobRecord.from_dict(json.loads(data)), last_seen) for data, last_seen in rows]
+
+    def purge(self) -> int:
+        """Delete listings not seen within the retention period and return how many were deleted"""
+        cutoff = time.time() - JOB_INDEX_RETENTION
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM jobs_fts WHERE rowid IN (SELECT id FROM jobs WHERE last_seen < ?)", (cutoff,))
+                purged = self._conn.execute("DELETE FROM jobs WHERE last_seen < ?", (cutoff,)).rowcount
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return purged
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the listing count and how often searches were answered from the index"""
+        with self._lock:
+            listings, fresh = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(last_seen >= ?), 0) FROM jobs", (time.time() - JOB_INDEX_MAX_AGE,)
+            ).fetchone()
+        return {"listings": listings, "fresh_listings": fresh, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+def create_job_index() -> Optional[JobIndex]:
+    """Open the job index, if one is configured and SQLite has FTS5"""
+    if not JOB_INDEX_PATH:
+        return None
     try:
-        # Make the request with random headers
-        response = requests.get(url, headers=get_random_headers(), timeout=15)
-        response.raise_for_status()
+        return JobIndex(JOB_INDEX_PATH)
+    except sqlite3.Error as e:
+        logger.error(f"Could not open job index at {JOB_INDEX_PATH}, scraping every search: {str(e)}")
+        return None
 
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-        job_listings = []
+JOB_INDEX = create_job_index()
 
-        # Log the HTML structure to help with debugging
-        logger.info("Parsing LinkedIn HTML response...")
+# Index writes running in worker threads, kept so shutdown can wait for them before closing the index
+INDEX_WRITES: set = set()
 
-        # Try multiple selectors for job cards as LinkedIn frequently changes their HTML structure
-        job_cards = []
-        selectors = [
-            'div.base-card.relative',
-            'li.jobs-search-results__list-item',
-            'div.job-search-card',
-            'div.base-search-card',
-            'li.result-card',
-            'div.job-card-container'
-        ]
+def index_jobs(query: str, jobs: List[JobRecord]) -> None:
+    """Add scraped jobs to the job index, if there is one"""
+    if JOB_INDEX is None or not jobs:
+        return
+    try:
+        JOB_INDEX.upsert(jobs, query)
+    except sqlite3.Error as e:
+        logger.error(f"Error indexing jobs for '{query}': {str(e)}")
 
-        for selector in selectors:
-            cards = soup.select(selector)
-            if cards:
-                logger.info(f"Found {len(cards)} job cards using selector: {selector}")
-                job_cards = cards[:limit]
-                break
+def schedule_index_jobs(query: str, jobs: List[JobRecord]) -> None:
+    """Add scraped jobs to the job index in a worker thread, without waiting for the SQLite write"""
+    if JOB_INDEX is None or not jobs:
+        return
+    task = asyncio.ensure_future(asyncio.to_thread(index_jobs, query, jobs))
+    INDEX_WRITES.add(task)
+    task.add_done_callback(INDEX_WRITES.discard)
 
-        if not job_cards:
-            logger.warning("No job cards found on LinkedIn using any of the known selectors")
-            # Try a more generic approach
-            possible_cards = soup.find_all('div', class_=lambda c: c and ('job' in c.lower() or 'card' in c.lower()))
-            if possible_cards:
-                logger.info(f"Found {len(possible_cards)} potential job cards using generic approach")
-                job_cards = possible_cards[:limit]
+async def search_job_index(
+    query: str,
+    location: Optional[str],
+    sites: List[str],
+    limit: int
+) -> Tuple[List[JobRecord], Dict[int, float]]:
+    """
+    Get fresh indexed jobs for a search on some job boards, deduplicated, or nothing without an index
 
-        for card in job_cards:
-            try:
-                # Try multiple selectors for each element as LinkedIn frequently changes their HTML structure
+    Also returns the seconds since each job was last scraped, keyed by the
+    id() of its record, so callers can note the age of the ones they use.
+    """
+    if JOB_INDEX is None:
+        return [], {}
+    try:
+        # Ask for extra listings, since near-duplicates are merged afterwards. The FTS query runs
+        # in a worker thread, to keep SQLite off the event loop
+        sources = [EXTRACTORS[site].source for site in sites]
+        rows = await asyncio.to_thread(JOB_INDEX.search, query, location, sources, limit * 2)
+    except sqlite3.Error as e:
+        logger.error(f"Error searching job index for '{query}': {str(e)}")
+        return [], {}
+    now = time.time()
+    ages = {id(job): max(0.0, now - last_seen) for job, last_seen in rows}
+    return dedupe_jobs([job for job, _ in rows]), ages
+
+def observe_index_age(age: Optional[ResultAge], jobs: List[JobRecord], ages: Dict[int, float]) -> None:
+    """Note in `age` how long ago the indexed ones among `jobs` were scraped"""
+    if age is None:
+        return
+    for job in jobs:
+        if id(job) in ages:
+            age.observe(ages[id(job)])
 
-                # Extract job title
-                title_selectors = [
-                    'h3.base-search-card__title', 'h3.job-search-card__title',
-                    'h3.result-card__title', 'h3.base-card__title',
-                    'span.screen-reader-text', 'a.job-card-container__link'
-                ]
-                title_elem = None
-                for selector in title_selectors:
-                    title_elem = card.select_one(selector)
-                    if title_elem:
-                        break
-
-                # Extract company name
-                company_selectors = [
-                    'h4.base-search-card__subtitle', 'h4.job-search-card__subtitle',
-                    'h4.result-card__subtitle', 'a.job-card-container__company-name',
-                    'div.base-search-card__info a', 'span.company-name'
-                ]
-                company_elem = None
-                for selector in company_selectors:
-                    company_elem = card.select_one(selector)
-                    if company_elem:
-                        break
-
-                # Extract location
-                location_selectors = [
-                    'span.job-search-card__location', 'div.job-search-card__location',
-                    'span.job-result-card__location', 'span.location',
-                    'div.base-search-card__metadata span.job-search-card__location'
-                ]
-                location_elem = None
-                for selector in location_selectors:
-                    location_elem = card.select_one(selector)
-                    if location_elem:
-                        break
-
-                # Extract values from elements
-                title = title_elem.text.strip() if title_elem else "Unknown Title"
-                company = company_elem.text.strip() if company_elem else "Unknown Company"
-                job_location = location_elem.text.strip() if location_elem else "Unknown Location"
-
-                # Extract job URL
-                job_url = ""
-                # Try multiple selectors for job links
-                link_selectors = [
-                    'a.base-card__full-link', 'a.job-card-container__link',
-                    'a.result-card__full-card-link', 'a.job-search-card__link'
-                ]
-                for selector in link_selectors:
-                    job_link = card.select_one(selector)
-                    if job_link and 'href' in job_link.attrs:
-                        job_url = job_link['href']
-                        break
-
-                # If no link found, try to find any link in the card
-                if not job_url:
-                    any_link = card.select_one('a[href]')
-                    if any_link and 'href' in any_link.attrs:
-                        job_url = any_link['href']
-
-                # Extract time posted
-                posted = "Recently"
-                time_selectors = [
-                    'time.job-search-card__listdate', 'time.job-result-card__listdate',
-                    'div.base-search-card__metadata time', 'span.job-search-card__listdate'
-                ]
-                for selector in time_selectors:
-                    time_elem = card.select_one(selector)
-                    if time_elem and 'datetime' in time_elem.attrs:
-                        posted = time_elem['datetime']
-                        break
-
-                # Create job listing object
-                job = {
-                    "title": title,
-                    "company": company,
-                    "location": job_location,
-                    "salary": "Not specified",  # LinkedIn rarely shows salary
-                    "type": "Not specified",
-                    "summary": "Visit LinkedIn for details",
-                    "url": job_url,
-                    "source": "LinkedIn",
-                    "posted": posted
-                }
+async def find_jobs(
+    query: str,
+    location: Optional[str],
+    source: Optional[str],
+    limit: int,
+    force_refresh: bool = False,
+    age: Optional[ResultAge] = None
+) -> Dict[str, Any]:
+    """
+    Search for jobs, answering from the job index or per-board caches when possible
 
-                job_listings.append(job)
-                logger.info(f"Successfully parsed job: {title} at {company}")
-            except Exception as e:
-                logger.warning(f"Error parsing LinkedIn job card: {str(e)}")
-                continue
+    With force_refresh, every selected board is scraped again, bypassing both.
+    The age of the oldest cached board results or indexed listings used is
+    noted in `age`.
+    """
+    source_used = source.lower() if source else "all"
+    deadline = asyncio.get_running_loop().time() + SEARCH_BUDGET
+
+    selected = [name for name in SCRAPERS if source_used in (name, "all")]
+
+    # Answer from the local job index when it has enough fresh listings
+    indexed, index_ages = await search_job_index(query, location, selected, limit) if not force_refresh else ([], {})
+    if JOB_INDEX is not None and len(indexed) >= limit:
+        JOB_INDEX.hits += 1
+        logger.info(f"Answered search for '{query}' from the job index")
+        indexed_jobs = indexed[:limit]
+        observe_index_age(age, indexed_jobs, index_ages)
+        return {
+            "query": query,
+            "location": location,
+            "source": source_used,
+            "results_count": len(indexed_jobs),
+            "timed_out_sources": [],
+            "skipped_sources": [],
+            "jobs": indexed_jobs
+        }
+    if JOB_INDEX is not None and not force_refresh:
+        JOB_INDEX.misses += 1
 
-        logger.info(f"Found {len(job_listings)} jobs on LinkedIn")
-        return job_listings
+    jobs, timed_out, skipped = await scrape_sources(selected, query, location, limit, deadline, force_refresh, age)
 
-    except Exception as e:
-        logger.error(f"LinkedIn scraping error: {str(e)}")
-        # Return an empty list but don't fail completely
-        return []
+    # If no jobs found from the requested source, try the sources not tried yet
+    if not jobs and source_used != "all":
+        logger.warning(f"No jobs found from {source_used}, trying other sources")
+        others = [name for name in SCRAPERS if name not in selected]
+        fallback_jobs, fallback_timed_out, fallback_skipped = await scrape_sources(
+            others, query, location, limit, deadline, force_refresh, age
+        )
+        jobs.extend(fallback_jobs)
+        timed_out.extend(fallback_timed_out)
+        skipped.extend(fallback_skipped)
 
-@app.get("/api/jobs/skills/{skill}")
-async def get_jobs_by_skill(skill: str, location: Optional[str] = None, limit: int = 10):
-    """Get job listings for a specific skill"""
-    return await search_jobs(query=skill, location=location, limit=limit)
+    # Deduplicate jobs, merging near-duplicate listings from different boards. Fresh
+    # scrapes come first, topped up with the indexed listings found above
+    unique_jobs = dedupe_jobs(jobs + indexed)
+
+    # Limit to requested number
+    unique_jobs = unique_jobs[:limit]
+    observe_index_age(age, unique_jobs, index_ages)
+
+    return {
+        "query": query,
+        "location": location,
+        "source": source_used,
+        "results_count": len(unique_jobs),
+        "timed_out_sources": timed_out,
+        "skipped_sources": skipped,
+        "jobs": unique_jobs
+    }
 
-async def get_job_recommendations_internal(skills: str, experience_level: Optional[str] = None, limit: int = 5):
+@app.get("/api/jobs/search")
+async def search_jobs(
+    query: str,
+    location: Optional[str] = None,
+    source: Optional[str] = "all",
+    limit: int = 10
+):
     """
-    Internal function to get job recommendations based on skills and experience level
+    Search for jobs based on query and location
+
+    Parameters:
+    - query: Job title, skills, or keywords
+    - location: Location for job search (city, state, country)
+    - source: Job site to scrape (indeed, linkedin, simplyhired, all)
+    - limit: Maximum number of results to return
     """
-    skill_list = [skill.strip() for skill in skills.split(",")]
-    logger.info(f"Getting job recommendations for skills: {skill_list} with experience level: {experience_level}")
+    try:
+        return await find_jobs(query, location, source, limit)
+    except Exception as e:
+        logger.error(f"Error in search_jobs: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search jobs: {str(e)}")
 
-    # Create skill-specific queries
-    results = []
+# Streamed responses send one frame per batch of jobs as sources finish, then a summary frame
+STREAM_FORMATS = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+def encode_frame(frame: Dict[str, Any], stream_format: str) -> str:
+    """Encode a frame as a line of NDJSON or a Server-Sent Event named after its type"""
+    data = json.dumps(frame, default=json_default)
+    if stream_format == "sse":
+        return f"event: {frame['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+def stream_frames(frames: AsyncIterator[Dict[str, Any]], stream_format: str) -> StreamingResponse:
+    """Stream frames in the requested format, ending with an error frame if producing them fails"""
+    if stream_format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown stream format: {stream_format}")
 
-    # Process each skill in parallel for faster results
-    async def process_skill(skill):
+    async def body():
         try:
-            # Modify query based on experience level
-            query = skill
-            if experience_level:
-                query = f"{experience_level} {skill}"
-
-            # Get results from all sources for better coverage
-            skill_results = await search_jobs(
-                query=query,
-                source="all",  # Use all sources for better coverage
-                limit=max(5, limit//len(skill_list))  # Get more results per skill for better filtering
-            )
+            async for frame in frames:
+                yield encode_frame(frame, stream_format)
+        except Exception as e:
+            logger.error(f"Error while streaming results: {str(e)}")
+            yield encode_frame({"type": "error", "detail": str(e)}, stream_format)
 
-            if "jobs" in skill_results and skill_results["jobs"]:
-                logger.info(f"Found {len(skill_results['jobs'])} jobs for skill: {skill}")
-                return skill_results["jobs"]
-            else:
-                logger.warning(f"No jobs found for skill: {skill}")
-                return []
-        except Exception as skill_error:
-            logger.error(f"Error processing skill {skill}: {str(skill_error)}")
-            return []
+    # Ask proxies not to buffer, so each frame reaches the client as soon as it is sent
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(body(), media_type=STREAM_FORMATS[stream_format], headers=headers)
 
-    # Process skills in parallel
-    import asyncio
-    skill_results = await asyncio.gather(*[process_skill(skill) for skill in skill_list])
+async def search_frames(
+    query: str,
+    location: Optional[str],
+    source: Optional[str],
+    limit: int,
+    age: Optional[ResultAge] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Search for jobs like search_jobs, yielding each source's new jobs as soon as it finishes
 
-    # Flatten results
-    for result in skill_results:
-        results.extend(result)
+    Indexed listings are sent first. Each later "jobs" frame only holds jobs
+    that are not duplicates of ones already sent, and scraping stops once
+    `limit` jobs are out. The last frame is a "summary". The age of the oldest
+    cached board results or indexed listings used is noted in `age`.
+    """
+    source_used = source.lower() if source else "all"
+    deadline = asyncio.get_running_loop().time() + SEARCH_BUDGET
+    deduper = StreamDeduper()
+    timed_out = []
+    skipped = []
+
+    selected = [name for name in SCRAPERS if source_used in (name, "all")]
+    indexed, index_ages = await search_job_index(query, location, selected, limit)
+    indexed = deduper.add(indexed, limit)
+    observe_index_age(age, indexed, index_ages)
+    if indexed:
+        yield {"type": "jobs", "source": "index", "jobs": indexed}
+
+    others = [name for name in SCRAPERS if name not in selected]
+    for sources in (selected, others if source_used != "all" else []):
+        # Like search_jobs, only fall back to the other sources when the requested one found nothing
+        if len(deduper.sent) >= limit or (sources is others and deduper.sent):
+            break
+        async for name, jobs in iter_sources(sources, query, location, limit, deadline, age=age, skipped=skipped):
+            if jobs is None:
+                timed_out.append(name)
+                continue
+            new_jobs = deduper.add(jobs, limit - len(deduper.sent))
+            if new_jobs:
+                yield {"type": "jobs", "source": name, "jobs": new_jobs}
+            if len(deduper.sent) >= limit:
+                break
 
-    logger.info(f"Total jobs found before deduplication: {len(results)}")
+    yield {
+        "type": "summary",
+        "query": query,
+        "location": location,
+        "source": source_used,
+        "results_count": len(deduper.sent),
+        "timed_out_sources": timed_out,
+        "skipped_sources": skipped
+    }
 
-    # Deduplicate results based on job title and company
-    seen = set()
-    unique_results = []
+@app.get("/api/jobs/search/stream")
+async def stream_search_jobs(
+    query: str,
+    location: Optional[str] = None,
+    source: Optional[str] = "all",
+    limit: int = 10,
+    format: str = "ndjson"
+):
+    """
+    Search for jobs, streaming results as each source finishes
 
-    for job in results:
-        key = f"{job['title']}-{job['company']}"
-        if key not in seen:
-            seen.add(key)
-            unique_results.append(job)
+    Takes the same parameters as /api/jobs/search, plus format (ndjson or sse).
+    Sends "jobs" frames holding new, deduplicated jobs with the source they came
+    from, then a "summary" frame with the result count and timed out sources.
+    """
+    return stream_frames(search_frames(query, location, source, limit), format)
 
-    logger.info(f"Unique jobs after deduplication: {len(unique_results)}")
+@app.get("/api/jobs/sources")
+def get_source_state():
+    """Get the circuit breaker state and rate limit headroom of each job board"""
+    return {
+        site: {
+            "circuit": SOURCE_BREAKERS[site].snapshot(),
+            "rate_limit": {
+                "requests_per_minute": SOURCE_REQUESTS_PER_MINUTE,
+                "burst": SOURCE_BURST,
+                "available": round(SOURCE_LIMITERS[site].available(), 1),
+            },
+            "latency": SOURCE_LATENCIES[site].stats(),
+            "fetches": dict(SOURCE_FETCH_STATS[site]),
+        }
+        for site in SITE_SPECS
+    }
+
+@app.get("/api/jobs/selectors")
+def get_selector_state():
+    """Get which selectors currently match on each job board, to spot markup changes"""
+    return {site: extractor.selector_state() for site, extractor in EXTRACTORS.items()}
+
+@app.get("/api/jobs/skills/{skill}")
+async def get_jobs_by_skill(skill: str, location: Optional[str] = None, limit: int = 10):
+    """Get job listings for a specific skill"""
+    return await search_jobs(query=skill, location=location, limit=limit)
+
+def skill_search_query(skill: str, experience_level: Optional[str]) -> str:
+    """Build the job search query for one skill, prefixed with the experience level if any"""
+    return f"{experience_level} {skill}" if experience_level else skill
+
+def skill_search_limit(limit: int, skill_count: int) -> int:
+    """Get how many jobs to search for per skill, more than the share of the limit for better filtering"""
+    return max(5, limit // skill_count)
+
+async def search_skill(
+    skill: str,
+    query: str,
+    limit: int,
+    force_refresh: bool = False,
+    age: Optional[ResultAge] = None
+) -> Tuple[List[JobRecord], List[str], List[str]]:
+    """Search all sources for one skill, returning (jobs, timed out sources, skipped sources) and nothing on errors"""
+    try:
+        # Get results from all sources for better coverage
+        skill_results = await find_jobs(query, None, "all", limit, force_refresh, age)
+        timed_out = skill_results.get("timed_out_sources", [])
+        skipped = skill_results.get("skipped_sources", [])
+        if "jobs" in skill_results and skill_results["jobs"]:
+            logger.info(f"Found {len(skill_results['jobs'])} jobs for skill: {skill}")
+            return skill_results["jobs"], timed_out, skipped
+        logger.warning(f"No jobs found for skill: {skill}")
+        return [], timed_out, skipped
+    except Exception as skill_error:
+        logger.error(f"Error processing skill {skill}: {str(skill_error)}")
+        return [], [], []
+
+def assemble_recommendations(
+    skill_list: List[str],
+    experience_level: Optional[str],
+    limit: int,
+    results: List[JobRecord],
+    timed_out_sources: set,
+    skipped_sources: set
+) -> Dict[str, Any]:
+    """Deduplicate and rank the jobs found for a set of skills into a recommendations response"""
+    logger.info(f"Total jobs found before deduplication: {len(results)}")
 
-    # Sort results by relevance (if a job matches multiple skills, it's more relevant)
-    # Count how many skills are mentioned in each job title or summary
-    for job in unique_results:
-        job_text = f"{job['title']} {job.get('summary', '')}".lower()
-        skill_matches = sum(1 for skill in skill_list if skill.lower() in job_text)
-        job['relevance_score'] = skill_matches
+    # Deduplicate results, merging near-duplicate listings from different boards
+    unique_results = dedupe_jobs(results)
+
+    logger.info(f"Unique jobs after deduplication: {len(unique_results)}")
 
-    # Sort by relevance score (descending)
-    unique_results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+    # Sort results by relevance to the skills, weighting rarer skills and title mentions higher
+    unique_results = rank_jobs(unique_results, skill_list)
 
     # Limit to requested number
     unique_results = unique_results[:limit]
 
-    # Remove the temporary relevance score field
-    for job in unique_results:
-        if 'relevance_score' in job:
-            del job['relevance_score']
-
     logger.info(f"Returning {len(unique_results)} job recommendations")
 
     return {
         "skills": skill_list,
         "experience_level": experience_level,
         "results_count": len(unique_results),
+        "timed_out_sources": sorted(timed_out_sources),
+        "skipped_sources": sorted(skipped_sources),
         "jobs": unique_results
     }
 
+async def get_job_recommendations_internal(
+    skills: str,
+    experience_level: Optional[str] = None,
+    limit: int = 5,
+    force_refresh: bool = False,
+    age: Optional[ResultAge] = None
+):
+    """
+    Internal function to get job recommendations based on skills and experience level
+    """
+    skill_list = list(normalize_skills(skills))
+    experience_level = normalize_experience_level(experience_level)
+    logger.info(f"Getting job recommendations for skills: {skill_list} with experience level: {experience_level}")
+
+    # Process skills in parallel, one search per skill
+    per_skill_limit = skill_search_limit(limit, len(skill_list))
+    skill_results = await asyncio.gather(*[
+        search_skill(skill, skill_search_query(skill, experience_level), per_skill_limit, force_refresh, age)
+        for skill in skill_list
+    ])
+
+    # Flatten results
+    results = []
+    timed_out_sources = set()
+    skipped_sources = set()
+    for jobs, timed_out, skipped in skill_results:
+        results.extend(jobs)
+        timed_out_sources.update(timed_out)
+        skipped_sources.update(skipped)
+
+    return assemble_recommendations(skill_list, experience_level, limit, results, timed_out_sources, skipped_sources)
+
+# Batch recommendations for bulk resume imports
+BATCH_MAX_ITEMS = int(os.environ.get("JOB_SCRAPER_BATCH_MAX_ITEMS", "500"))  # Recommendation requests per batch
+BATCH_CONCURRENCY = int(os.environ.get("JOB_SCRAPER_BATCH_CONCURRENCY", "8"))  # Skill searches running at once across all batches
+
+# Shared by all batch calls, so concurrent batches cannot multiply the upstream load
+BATCH_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+def get_batch_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore capping batch skill searches, creating it on first use"""
+    global BATCH_SEMAPHORE
+
+    if BATCH_SEMAPHORE is None:
+        BATCH_SEMAPHORE = asyncio.Semaphore(BATCH_CONCURRENCY)
+    return BATCH_SEMAPHORE
+
+class RecommendationRequest(BaseModel):
+    """One item of a batch, with the same fields as the recommendations query parameters"""
+    skills: str
+    experience_level: Optional[str] = None
+    limit: int = 5
+
+class BatchRecommendationsRequest(BaseModel):
+    """A batch of recommendation requests, such as one per imported resume"""
+    requests: List[RecommendationRequest]
+
 @app.get("/api/jobs/recommendations")
 async def get_job_recommendations(skills: str, experience_level: Optional[str] = None, limit: int = 5):
     """
@@ -836,25 +3250,29 @@ async def get_job_recommendations(skills: str, experience_level: Optional[str] =
     - experience_level: Junior, Mid, Senior, etc.
     - limit: Maximum number of results to return
     """
+    recommendation_query = RecommendationQuery.from_params(skills, experience_level, limit)
+    if not recommendation_query.skills:
+        raise HTTPException(status_code=400, detail="At least one skill is required")
+    POPULARITY.record(recommendation_query)
+
     try:
         # Check cache first
-        cache_key = get_cache_key(skills, experience_level, limit)
-        cached_data = get_cached_jobs(cache_key)
+        cache_key = recommendation_query.cache_key
+        cached = await get_cached_jobs(cache_key)
 
-        if cached_data:
-            # Return cached data
-            return cached_data
+        if cached:
+            # Return cached data, revalidating it in the background if it is stale
+            cached_data, age, stale = cached
+            if stale:
+                schedule_revalidation(recommendation_query)
+            return with_freshness(cached_data, age, stale)
 
         # No cache hit, get fresh data
         logger.info(f"No cache hit for key: {cache_key}, fetching fresh data")
 
-        # Get job recommendations
-        result = await get_job_recommendations_internal(skills, experience_level, limit)
-
-        # Cache the result
-        set_cached_jobs(cache_key, result)
-
-        return result
+        # Get job recommendations and cache them
+        result, age = await load_job_recommendations(recommendation_query)
+        return with_freshness(result, age, False, cached=False)
 
     except Exception as e:
         logger.error(f"Error in get_job_recommendations: {str(e)}")
@@ -863,9 +3281,11 @@ async def get_job_recommendations(skills: str, experience_level: Optional[str] =
         try:
             logger.info("Trying fallback approach for job recommendations")
 
-            # Parse skills
-            skill_list = [skill.strip() for skill in skills.split(",")]
+            skill_list = list(recommendation_query.skills)
+            experience_level = recommendation_query.experience_level
             results = []
+            skipped_sources = set()
+            age = ResultAge()
 
             # Process each skill sequentially
             for skill in skill_list:
@@ -875,24 +3295,20 @@ async def get_job_recommendations(skills: str, experience_level: Optional[str] =
                     query = f"{experience_level} {skill}"
 
                 # Get results from LinkedIn only for simplicity (since it's working better)
-                skill_results = await search_jobs(
-                    query=query,
-                    source="linkedin",  # Use LinkedIn only for simplicity
-                    limit=max(3, limit//len(skill_list))
+                skill_results = await find_jobs(
+                    query,
+                    None,
+                    "linkedin",  # Use LinkedIn only for simplicity
+                    max(3, limit//len(skill_list)),
+                    age=age
                 )
 
                 if "jobs" in skill_results and skill_results["jobs"]:
                     results.extend(skill_results["jobs"])
+                skipped_sources.update(skill_results.get("skipped_sources", []))
 
             # Deduplicate and limit results
-            seen = set()
-            unique_results = []
-
-            for job in results:
-                key = f"{job['title']}-{job['company']}"
-                if key not in seen:
-                    seen.add(key)
-                    unique_results.append(job)
+            unique_results = dedupe_jobs(results)
 
             # Limit to requested number
             unique_results = unique_results[:limit]
@@ -903,17 +3319,195 @@ async def get_job_recommendations(skills: str, experience_level: Optional[str] =
                 "skills": skill_list,
                 "experience_level": experience_level,
                 "results_count": len(unique_results),
+                "skipped_sources": sorted(skipped_sources),
                 "jobs": unique_results
             }
 
             # Cache the fallback result too
-            set_cached_jobs(cache_key, result)
+            set_cached_jobs(cache_key, result, recommendation_query, age=age.seconds)
 
-            return result
+            return with_freshness(result, age.seconds, False, cached=False)
         except Exception as fallback_error:
             logger.error(f"Fallback approach also failed: {str(fallback_error)}")
             raise HTTPException(status_code=500, detail=f"Failed to get job recommendations: {str(e)}")
 
+@app.post("/api/jobs/recommendations/batch")
+async def get_batch_job_recommendations(batch: BatchRecommendationsRequest):
+    """
+    Get job recommendations for many skill sets at once
+
+    Items already cached are answered from the cache. For the rest, the distinct
+    skill searches of all items are run once each, at most BATCH_CONCURRENCY
+    at a time across all batches, and each item's results are then ranked for
+    its own skills.
+    Results come back in request order with a status per item, so one bad
+    item does not fail the batch.
+    """
+    if len(batch.requests) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_ITEMS} requests are allowed per batch")
+
+    items: List[Optional[Dict[str, Any]]] = [None] * len(batch.requests)
+    to_load: Dict[str, Tuple[RecommendationQuery, List[int]]] = {}
+    for index, request in enumerate(batch.requests):
+        recommendation_query = RecommendationQuery.from_params(request.skills, request.experience_level, request.limit)
+        if not recommendation_query.skills:
+            items[index] = {"index": index, "status": 400, "error": "At least one skill is required"}
+            continue
+        POPULARITY.record(recommendation_query)
+
+        cached = await get_cached_jobs(recommendation_query.cache_key)
+        if cached:
+            cached_data, age, stale = cached
+            if stale:
+                schedule_revalidation(recommendation_query)
+            items[index] = {"index": index, "status": 200, "result": with_freshness(cached_data, age, stale)}
+            continue
+
+        # Identical items in the batch share one result
+        to_load.setdefault(recommendation_query.cache_key, (recommendation_query, []))[1].append(index)
+
+    # Union of the skill searches the uncached items need, each at the largest limit asked for
+    searches: Dict[str, Tuple[str, int]] = {}
+    for recommendation_query, _ in to_load.values():
+        per_skill_limit = skill_search_limit(recommendation_query.limit, len(recommendation_query.skills))
+        for skill in recommendation_query.skills:
+            search_query = skill_search_query(skill, recommendation_query.experience_level)
+            previous_limit = searches.get(search_query, (skill, 0))[1]
+            searches[search_query] = (skill, max(previous_limit, per_skill_limit))
+    logger.info(f"Batch of {len(batch.requests)} requests needs {len(searches)} distinct skill searches")
+
+    semaphore = get_batch_semaphore()
+
+    search_ages: Dict[str, ResultAge] = {search_query: ResultAge() for search_query in searches}
+
+    async def run_search(search_query: str, skill: str, search_limit: int):
+        async with semaphore:
+            return search_query, await search_skill(skill, search_query, search_limit, age=search_ages[search_query])
+
+    search_results = dict(await asyncio.gather(*[
+        run_search(search_query, skill, search_limit) for search_query, (skill, search_limit) in searches.items()
+    ]))
+
+    for recommendation_query, indexes in to_load.values():
+        try:
+            per_skill_limit = skill_search_limit(recommendation_query.limit, len(recommendation_query.skills))
+            results = []
+            timed_out_sources = set()
+            skipped_sources = set()
+            age = ResultAge()
+            for skill in recommendation_query.skills:
+                search_query = skill_search_query(skill, recommendation_query.experience_level)
+                jobs, timed_out, skipped = search_results[search_query]
+                results.extend(jobs[:per_skill_limit])
+                timed_out_sources.update(timed_out)
+                skipped_sources.update(skipped)
+                age.observe(search_ages[search_query].seconds)
+
+            result = assemble_recommendations(
+                list(recommendation_query.skills),
+                recommendation_query.experience_level,
+                recommendation_query.limit,
+                results,
+                timed_out_sources,
+                skipped_sources
+            )
+            set_cached_jobs(recommendation_query.cache_key, result, recommendation_query, age=age.seconds)
+            item = {"status": 200, "result": with_freshness(result, age.seconds, False, cached=False)}
+        except Exception as e:
+            logger.error(f"Error in batch recommendations for {recommendation_query.skills}: {str(e)}")
+            item = {"status": 500, "error": f"Failed to get job recommendations: {str(e)}"}
+        for index in indexes:
+            items[index] = {"index": index, **item}
+
+    return {
+        "results_count": len(items),
+        "searches": len(searches),
+        "results": items
+    }
+
+async def recommendation_frames(recommendation_query: RecommendationQuery) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Get job recommendations like get_job_recommendations, yielding jobs as each skill's sources finish
+
+    The skill searches run concurrently and their frames are interleaved as
+    they arrive, deduplicated across skills and capped at the limit. Ranking
+    needs every job, so the "summary" frame carries the full ranked response,
+    which is also cached. Cached responses are sent as one frame right away.
+    """
+    cached = await get_cached_jobs(recommendation_query.cache_key)
+    if cached:
+        cached_data, age, stale = cached
+        if stale:
+            schedule_revalidation(recommendation_query)
+        yield {"type": "jobs", "skill": None, "jobs": cached_data["jobs"]}
+        yield {"type": "summary", **with_freshness(cached_data, age, stale)}
+        return
+
+    skill_list = list(recommendation_query.skills)
+    experience_level = recommendation_query.experience_level
+    per_skill_limit = skill_search_limit(recommendation_query.limit, len(skill_list))
+    frames: asyncio.Queue = asyncio.Queue()
+    age = ResultAge()
+
+    async def search_skill_frames(skill: str):
+        query = skill_search_query(skill, experience_level)
+        try:
+            async for frame in search_frames(query, None, "all", per_skill_limit, age):
+                await frames.put((skill, frame))
+        except Exception as skill_error:
+            logger.error(f"Error processing skill {skill}: {str(skill_error)}")
+        finally:
+            await frames.put((skill, None))
+
+    tasks = [asyncio.create_task(search_skill_frames(skill)) for skill in skill_list]
+    deduper = StreamDeduper()
+    results = []
+    timed_out_sources = set()
+    skipped_sources = set()
+    try:
+        for _ in skill_list:
+            while True:
+                skill, frame = await frames.get()
+                if frame is None:
+                    break
+                if frame["type"] == "summary":
+                    timed_out_sources.update(frame["timed_out_sources"])
+                    skipped_sources.update(frame["skipped_sources"])
+                    continue
+                results.extend(frame["jobs"])
+                new_jobs = deduper.add(frame["jobs"], recommendation_query.limit - len(deduper.sent))
+                if new_jobs:
+                    yield {"type": "jobs", "skill": skill, "source": frame["source"], "jobs": new_jobs}
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    result = assemble_recommendations(
+        skill_list, experience_level, recommendation_query.limit, results, timed_out_sources, skipped_sources
+    )
+    set_cached_jobs(recommendation_query.cache_key, result, recommendation_query, age=age.seconds)
+    yield {"type": "summary", **with_freshness(result, age.seconds, False, cached=False)}
+
+@app.get("/api/jobs/recommendations/stream")
+async def stream_job_recommendations(
+    skills: str,
+    experience_level: Optional[str] = None,
+    limit: int = 5,
+    format: str = "ndjson"
+):
+    """
+    Get job recommendations, streaming jobs as each skill's sources finish
+
+    Takes the same parameters as /api/jobs/recommendations, plus format (ndjson
+    or sse). Sends "jobs" frames as jobs are found, then a "summary" frame with
+    the complete ranked response, in the same shape as the non-streaming one.
+    """
+    recommendation_query = RecommendationQuery.from_params(skills, experience_level, limit)
+    if not recommendation_query.skills:
+        raise HTTPException(status_code=400, detail="At least one skill is required")
+    POPULARITY.record(recommendation_query)
+    return stream_frames(recommendation_frames(recommendation_query), format)
+
 def run_server():
     """Run the FastAPI server"""
     try:
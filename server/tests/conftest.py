@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Parse on the event loop, so tests need no worker processes
+os.environ.setdefault("JOB_SCRAPER_PARSE_EXECUTOR", "inline")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,33 @@
+from job_scraper import EXTRACTORS
+
+
+def indeed_page(count: int) -> bytes:
+    cards = "".join(
+        f'<div class="job_seen_beacon"><div><h2 class="jobTitle"><span>Engineer {i}</span></h2></div></div>'
+        for i in range(count)
+    )
+    return f'<html><body><!-- <div class="job_seen_beacon"> --><script>"<div class=\\"job_seen_beacon\\">"</script>{cards}</body></html>'.encode()
+
+
+def feed(body: bytes, limit: int, chunk_size: int):
+    counter = EXTRACTORS["indeed"].card_counter(limit)
+    for start in range(0, len(body), chunk_size):
+        if counter.feed_chunk(body[start:start + chunk_size], "utf-8"):
+            return counter, start + chunk_size
+    return counter, None
+
+
+def test_stops_once_limit_cards_are_complete():
+    body = indeed_page(20)
+    for chunk_size in (1, 7, 64, 4096):
+        counter, read = feed(body, 5, chunk_size)
+        assert counter.complete == 5
+        assert body[:read].count(b"</span></h2></div></div>") >= 5
+        # The scanned prefix ends with the fifth card, wherever the chunks split
+        assert body[:counter.end].endswith(b"Engineer 4</span></h2></div></div>")
+
+
+def test_ignores_cards_in_comments_and_scripts():
+    counter, read = feed(indeed_page(3), 4, 16)
+    assert read is None
+    assert counter.complete == 3
@@ -0,0 +1,51 @@
+import asyncio
+
+import aiohttp
+from yarl import URL
+
+import job_scraper
+from job_scraper import JOB_CACHE, CircuitBreaker, RecommendationQuery
+
+
+def open_breakers(monkeypatch, sites):
+    breakers = dict(job_scraper.SOURCE_BREAKERS)
+    for site in sites:
+        breakers[site] = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breakers[site].record_failure("HTTP 403")
+    monkeypatch.setattr(job_scraper, "SOURCE_BREAKERS", breakers)
+
+
+def test_skipped_sources_are_reported_and_not_cached(monkeypatch):
+    open_breakers(monkeypatch, job_scraper.SCRAPERS)
+    query = RecommendationQuery.from_params("cobol", None, 5)
+
+    result, age = asyncio.run(job_scraper.load_job_recommendations(query))
+
+    assert result["skipped_sources"] == sorted(job_scraper.SCRAPERS)
+    assert result["jobs"] == []
+    assert JOB_CACHE.get(query.cache_key) is None
+
+
+def test_coalesced_scrapes_count_one_failure(monkeypatch):
+    open_breakers(monkeypatch, [])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    monkeypatch.setitem(job_scraper.SOURCE_BREAKERS, "linkedin", breaker)
+    requests = []
+
+    async def forbidden(url, counter=None, conditions=None):
+        requests.append(url)
+        await asyncio.sleep(0.05)
+        request_info = aiohttp.RequestInfo(URL(url), "GET", {}, URL(url))
+        raise aiohttp.ClientResponseError(request_info, (), status=403)
+
+    monkeypatch.setattr(job_scraper, "fetch_page", forbidden)
+
+    async def scrape_concurrently():
+        return await asyncio.gather(
+            *[job_scraper.scrape_site("linkedin", "breaker flight", None, 5) for _ in range(5)]
+        )
+
+    assert asyncio.run(scrape_concurrently()) == [[]] * 5
+    assert len(requests) == 1
+    assert breaker.snapshot()["consecutive_failures"] == 1
+    assert breaker.state == "closed"
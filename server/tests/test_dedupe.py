@@ -0,0 +1,30 @@
+from job_scraper import JobRecord, cluster_jobs, job_identity, job_tokens
+
+
+def job(title: str, company: str, location: str = "Remote") -> JobRecord:
+    return JobRecord(title, company, location, "Not specified", "Full-time", "", f"https://example.com/{title}", "indeed", "")
+
+
+def test_near_duplicates_cluster_together():
+    jobs = [
+        job("Sr. Python Developer", "Acme Inc"),
+        job("Java Engineer", "Globex"),
+        job("Senior Python Developer", "ACME"),
+    ]
+    assert cluster_jobs(jobs) == [[0, 2], [1]]
+
+
+def test_non_latin_titles_are_not_merged():
+    jobs = [
+        job("ソフトウェアエンジニア", "株式会社アクメ", "東京"),
+        job("データサイエンティスト", "株式会社グロービックス", "東京"),
+        job("Программист", "Яндекс", "Москва"),
+    ]
+    assert all(job_tokens(item) for item in jobs)
+    assert cluster_jobs(jobs) == [[0], [1], [2]]
+    assert len({job_identity(item) for item in jobs}) == 3
+
+
+def test_jobs_without_tokens_only_match_the_same_text():
+    jobs = [job("???", "-"), job("!!!", "-"), job("???", "-")]
+    assert cluster_jobs(jobs) == [[0, 2], [1]]
@@ -0,0 +1,42 @@
+import asyncio
+from datetime import timedelta
+
+from job_scraper import JobCache, SQLiteCacheStore
+
+
+def make_cache(path) -> JobCache:
+    return JobCache(10, 1024 * 1024, timedelta(minutes=5), SQLiteCacheStore(str(path), "entries"))
+
+
+def test_store_io_runs_without_the_cache_lock(tmp_path):
+    cache = make_cache(tmp_path / "cache.db")
+    store = cache.store
+    calls = []
+
+    def check(method):
+        def wrapper(*args):
+            calls.append(method.__name__)
+            assert not cache._lock.locked()
+            return method(*args)
+        return wrapper
+
+    store.save = check(store.save)
+    store.load = check(store.load)
+
+    cache.set("key", {"jobs": [1, 2]})
+    cache.flush()
+    cache._entries.clear()
+    assert asyncio.run(cache.get_async("key")) == {"jobs": [1, 2]}
+    assert calls == ["save", "load"]
+    cache.close()
+
+
+def test_writes_reach_the_store_before_it_closes(tmp_path):
+    cache = make_cache(tmp_path / "cache.db")
+    for index in range(5):
+        cache.set(f"key{index}", index)
+    cache.close()
+
+    reopened = make_cache(tmp_path / "cache.db")
+    assert [reopened.get(f"key{index}") for index in range(5)] == list(range(5))
+    reopened.close()
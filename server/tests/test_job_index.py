@@ -0,0 +1,22 @@
+import asyncio
+
+import job_scraper
+from job_scraper import JobIndex, JobRecord, ResultAge
+
+
+def test_index_answers_report_listing_age(tmp_path, monkeypatch):
+    index = JobIndex(str(tmp_path / "index.db"))
+    jobs = [
+        JobRecord(f"Python Developer {i}", f"Company {i}", "Remote", "", "", "", f"https://example.com/{i}", "Indeed", "")
+        for i in range(3)
+    ]
+    index.upsert(jobs, "python")
+    index._conn.execute("UPDATE jobs SET last_seen = last_seen - 600")
+    monkeypatch.setattr(job_scraper, "JOB_INDEX", index)
+
+    age = ResultAge()
+    result = asyncio.run(job_scraper.find_jobs("python", None, "indeed", 3, age=age))
+    index.close()
+
+    assert result["results_count"] == 3
+    assert 600 <= age.seconds < 660
@@ -0,0 +1,48 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import job_scraper
+from job_scraper import PAGE_CACHE, FetchedPage, fetch_jobs, normalize_url
+
+CARDS = b'<div class="job_seen_beacon">A</div><div class="job_seen_beacon">B</div>'
+
+
+def run_fetch(url, pages, parsed):
+    async def fetch(url, conditions=None):
+        return pages.pop(0)
+
+    async def parse(body, encoding, limit):
+        parsed.append(body)
+        return [f"job {len(parsed)}"]
+
+    return asyncio.run(fetch_jobs(url, 2, parse, fetch))
+
+
+def test_early_stopped_pages_hash_only_the_cards_read():
+    url = "https://example.com/jobs?q=early-stop"
+    parsed = []
+    # The same page cut off at different chunk boundaries after the second card
+    pages = [
+        FetchedPage(CARDS + b'<div class="job_se', "utf-8", cards_end=len(CARDS)),
+        FetchedPage(CARDS + b'<div class="job_seen_beacon">C</d', "utf-8", cards_end=len(CARDS)),
+    ]
+    assert run_fetch(url, pages, parsed) == ["job 1"]
+    assert run_fetch(url, pages, parsed) == ["job 1"]
+    assert len(parsed) == 1
+
+
+def test_not_modified_page_stays_cached():
+    url = "https://example.com/jobs?q=not-modified"
+    parsed = []
+    pages = [
+        FetchedPage(CARDS, "utf-8", etag='"v1"'),
+        FetchedPage(b"", "utf-8", not_modified=True),
+    ]
+    run_fetch(url, pages, parsed)
+    key = normalize_url(url)
+    timestamp, data, size, meta = PAGE_CACHE._entries[key]
+    PAGE_CACHE._entries[key] = (datetime.now() - job_scraper.PAGE_CACHE_TTL + timedelta(seconds=5), data, size, meta)
+
+    assert run_fetch(url, pages, parsed) == ["job 1"]
+    assert PAGE_CACHE.age(key) < 5
+    assert PAGE_CACHE.get(key)["etag"] == '"v1"'
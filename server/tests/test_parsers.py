@@ -0,0 +1,20 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import job_scraper
+from job_scraper import SiteExtractor
+
+FIXTURES = Path(__file__).parent / "fixtures" / "parsers"
+
+
+@pytest.mark.parametrize("name", sorted(path.stem for path in FIXTURES.glob("*.html")))
+def test_parser_output_matches_fixture(name):
+    # The expected records were produced by the per-board parsers that the site specs replaced
+    site = name.split("_")[0]
+    extractor = SiteExtractor(site, job_scraper.SITE_SPECS[site])
+    html = (FIXTURES / f"{name}.html").read_text()
+    expected = json.loads((FIXTURES / f"{name}.json").read_text())
+
+    assert [job.to_dict() for job in extractor.parse(html, 10)] == expected
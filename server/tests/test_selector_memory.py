@@ -0,0 +1,61 @@
+import job_scraper
+from job_scraper import SELECTOR_DEMOTE_AFTER, SelectorMemory, SiteExtractor
+
+
+def linkedin_card(title: str, company: str = None) -> str:
+    subtitle = f'<h4 class="base-search-card__subtitle">{company}</h4>' if company else ""
+    return (
+        f'<div class="base-card relative"><div class="base-search-card__info">'
+        f'<h3 class="base-search-card__title">{title}</h3>{subtitle}'
+        f'<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{title}">{title}</a>'
+        f'</div></div>'
+    )
+
+
+def linkedin_page(*cards: str) -> str:
+    return f"<html><body><ul>{''.join(cards)}</ul></body></html>"
+
+
+def test_single_unusual_card_does_not_promote_broader_selector():
+    extractor = SiteExtractor("linkedin", job_scraper.SITE_SPECS["linkedin"])
+
+    # A card without the company subtitle is read through the broader selector
+    jobs = extractor.parse(linkedin_page(linkedin_card("Python Engineer 1")), 10)
+    assert jobs[0].company == "Python Engineer 1"
+
+    jobs = extractor.parse(linkedin_page(linkedin_card("Python Engineer 2", "ACME")), 10)
+    assert jobs[0].company == "ACME"
+    company = next(field for field in extractor.fields if field.name == "company")
+    assert company.memory.order[0] == 0
+
+
+def test_selector_tried_last_after_missing_in_a_row():
+    memory = SelectorMemory(["h4.narrow", "div a"], ["a"])
+    for _ in range(SELECTOR_DEMOTE_AFTER - 1):
+        memory.record(1, missed=[0])
+    assert memory.order == [0, 1, 2]
+
+    memory.record(1, missed=[0])
+    assert memory.order == [1, 0, 2]
+
+    # Matching again puts it back in spec order
+    memory.record(0)
+    assert memory.order == [0, 1, 2]
+
+
+def test_fallbacks_stay_last():
+    memory = SelectorMemory(["h4.narrow"], ["a"])
+    for _ in range(SELECTOR_DEMOTE_AFTER * 2):
+        memory.record(1, missed=[0])
+    assert memory.order == [0, 1]
+
+
+def test_merge_counts_applies_worker_matches():
+    memory = SelectorMemory(["h4.narrow", "div a"])
+    copy = SelectorMemory(["h4.narrow", "div a"])
+    before = copy.counts()
+    for _ in range(SELECTOR_DEMOTE_AFTER):
+        copy.record(1, missed=[0])
+    memory.merge_counts(before, copy.counts())
+    assert memory.order == [1, 0]
+    assert memory.state()["hits"] == {"h4.narrow": 0, "div a": SELECTOR_DEMOTE_AFTER}